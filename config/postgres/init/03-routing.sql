@@ -58,6 +58,12 @@ CREATE INDEX idx_routes_from ON routes(from_device_id);
 CREATE INDEX idx_routes_to ON routes(to_device_id);
 CREATE INDEX idx_routes_preset ON routes(preset_id);
 
+-- Active routes (preset_id IS NULL) are not covered by uq_route_connection
+-- because NULLs never compare equal
+CREATE UNIQUE INDEX idx_routes_active_connection
+    ON routes(from_device_id, from_port, to_device_id, to_port)
+    WHERE preset_id IS NULL;
+
 
 -- Route Presets: saved named routing configurations
 CREATE TABLE IF NOT EXISTS route_presets (
@@ -0,0 +1,25 @@
+-- =============================================================================
+-- Migration 014: Unique index for active routes
+-- =============================================================================
+
+-- uq_route_connection includes preset_id, and NULLs never compare equal, so it
+-- does not stop duplicate active routes (preset_id IS NULL). Drop any existing
+-- duplicates, keeping the oldest row, before adding a partial unique index.
+-- Rows without created_at sort as newest, and id breaks ties, so every
+-- duplicate pair compares non-NULL and none escape the delete.
+DELETE FROM routes a
+USING routes b
+WHERE a.preset_id IS NULL
+  AND b.preset_id IS NULL
+  AND a.from_device_id = b.from_device_id
+  AND a.from_port = b.from_port
+  AND a.to_device_id = b.to_device_id
+  AND a.to_port = b.to_port
+  AND (COALESCE(a.created_at, 'infinity'), a.id) > (COALESCE(b.created_at, 'infinity'), b.id);
+
+-- Serves the active-table scans and the duplicate check in route creation
+CREATE UNIQUE INDEX IF NOT EXISTS idx_routes_active_connection
+    ON routes(from_device_id, from_port, to_device_id, to_port)
+    WHERE preset_id IS NULL;
+
+SELECT 'Migration 014: idx_routes_active_connection created' AS status;
@@ -3,7 +3,7 @@ Database connection and SQLAlchemy models for Fleet Manager
 """
 
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy.orm import declarative_base
+from sqlalchemy.orm import declarative_base, relationship
 from sqlalchemy import Column, String, DateTime, Text, ARRAY, ForeignKey, text, Integer, Float, Boolean
 from sqlalchemy.dialects.postgresql import UUID as PGUUID, JSONB
 from sqlalchemy.types import TypeDecorator, UserDefinedType
@@ -185,6 +185,9 @@ class RoutePresetDB(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    # Read-only; load explicitly with joinedload (route writes go through RouteDB)
+    routes = relationship("RouteDB", lazy="raise", viewonly=True)
+
 
 # =============================================================================
 # Stream Models
@@ -5,7 +5,7 @@ CRUD operations for entities, hierarchy queries, and state management
 
 from fastapi import APIRouter, HTTPException, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete, func, text
+from sqlalchemy import select, delete, func, text, literal
 from sqlalchemy.orm import selectinload
 from typing import List, Optional, Dict, Any
 from uuid import UUID
@@ -24,7 +24,7 @@ from models import (
     EntityVariables, EntityVariablesResponse,
     ValidationWarning, StateValidationResult
 )
-from state_manager import state_manager
+from state_manager import state_manager, ValidationPlan
 from analytics_router import get_verbosity_for_entity
 
 logger = logging.getLogger(__name__)
@@ -409,37 +409,33 @@ async def get_entity_tree(
     result = await db.execute(query)
     root_entities = result.all()
 
-    async def build_tree(entity_id: UUID, current_depth: int) -> List[EntityTreeNode]:
-        if current_depth >= max_depth:
-            return []
-
+    # Fetch every descendant within max_depth in a single recursive query
+    # instead of one query per node
+    root_ids = [db_entity.id for db_entity, _ in root_entities]
+    children_by_parent: Dict[UUID, List[tuple]] = {}
+    if root_ids and max_depth > 1:
+        tree_cte = (
+            select(EntityDB.id, literal(1).label("depth"))
+            .where(EntityDB.parent_id.in_(root_ids))
+            .cte("tree", recursive=True)
+        )
+        tree_cte = tree_cte.union_all(
+            select(EntityDB.id, tree_cte.c.depth + 1)
+            .join(tree_cte, EntityDB.parent_id == tree_cte.c.id)
+            .where(tree_cte.c.depth + 1 < max_depth)
+        )
         result = await db.execute(
             select(EntityDB, EntityTypeDB)
+            .join(tree_cte, EntityDB.id == tree_cte.c.id)
             .join(EntityTypeDB, EntityDB.entity_type_id == EntityTypeDB.id)
-            .where(EntityDB.parent_id == entity_id)
             .order_by(EntityDB.name)
         )
-        children_rows = result.all()
-
-        nodes = []
-        for db_entity, entity_type in children_rows:
-            children = await build_tree(db_entity.id, current_depth + 1)
-            nodes.append(EntityTreeNode(
-                id=db_entity.id,
-                name=db_entity.name,
-                slug=db_entity.slug,
-                entity_type_id=db_entity.entity_type_id,
-                entity_type_name=entity_type.name,
-                status=db_entity.status or 'active',
-                state=db_entity.state or {},
-                children=children
-            ))
-        return nodes
+        for row in result.all():
+            children_by_parent.setdefault(row[0].parent_id, []).append(row)
 
-    tree = []
-    for db_entity, entity_type in root_entities:
-        children = await build_tree(db_entity.id, 1)
-        tree.append(EntityTreeNode(
+    def build_node(db_entity: EntityDB, entity_type: EntityTypeDB) -> EntityTreeNode:
+        # Rows are already typed by the DB, so skip per-node validation
+        return EntityTreeNode.model_construct(
             id=db_entity.id,
             name=db_entity.name,
             slug=db_entity.slug,
@@ -447,8 +443,23 @@ async def get_entity_tree(
             entity_type_name=entity_type.name,
             status=db_entity.status or 'active',
             state=db_entity.state or {},
-            children=children
-        ))
+            children=[]
+        )
+
+    # Attach children with an explicit stack rather than recursion
+    tree = []
+    stack = []
+    for db_entity, entity_type in root_entities:
+        node = build_node(db_entity, entity_type)
+        tree.append(node)
+        stack.append((db_entity.id, node))
+
+    while stack:
+        parent_id, parent_node = stack.pop()
+        for db_entity, entity_type in children_by_parent.get(parent_id, ()):
+            node = build_node(db_entity, entity_type)
+            parent_node.children.append(node)
+            stack.append((db_entity.id, node))
 
     return tree
 
@@ -697,54 +708,33 @@ async def validate_state_against_variables(
     missing_required = []
     undefined_keys = []
 
-    # Build variable lookup
-    all_vars = {}
-    for v in variables_data.get("inputs", []):
-        all_vars[v["name"]] = v
-    for v in variables_data.get("outputs", []):
-        all_vars[v["name"]] = v
-
-    # Type checking functions
-    def check_type(value: Any, expected_type: str) -> bool:
-        type_checks = {
-            "string": lambda v: isinstance(v, str),
-            "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
-            "boolean": lambda v: isinstance(v, bool),
-            "array": lambda v: isinstance(v, list),
-            "color": lambda v: isinstance(v, str),
-            "vector2": lambda v: isinstance(v, dict) and "x" in v and "y" in v,
-            "vector3": lambda v: isinstance(v, dict) and "x" in v and "y" in v and "z" in v,
-            "range": lambda v: isinstance(v, (int, float)),
-            "enum": lambda v: True,
-            "object": lambda v: isinstance(v, dict),
-        }
-        return type_checks.get(expected_type, lambda v: True)(value)
+    plan = ValidationPlan(variables_data)
+    checks = plan.checks
 
     # Check each state key
     for key, value in state.items():
-        if key in all_vars:
-            var_def = all_vars[key]
-            expected_type = var_def.get("type", "string")
-            if not check_type(value, expected_type):
-                actual_type = type(value).__name__
-                warnings.append(ValidationWarning(
-                    variable_name=key,
-                    expected_type=expected_type,
-                    actual_type=actual_type,
-                    message=f"State key '{key}' has type '{actual_type}' but expected '{expected_type}'"
-                ))
-        else:
+        check = checks.get(key)
+        if check is None:
             undefined_keys.append(key)
+        elif not check[1](value):
+            expected_type = check[0]
+            actual_type = type(value).__name__
+            warnings.append(ValidationWarning(
+                variable_name=key,
+                expected_type=expected_type,
+                actual_type=actual_type,
+                message=f"State key '{key}' has type '{actual_type}' but expected '{expected_type}'"
+            ))
 
     # Check for missing required inputs
-    for v in variables_data.get("inputs", []):
-        if v.get("required") and v["name"] not in state:
-            missing_required.append(v["name"])
+    for name, expected_type in plan.required:
+        if name not in state:
+            missing_required.append(name)
             warnings.append(ValidationWarning(
-                variable_name=v["name"],
-                expected_type=v.get("type", "string"),
+                variable_name=name,
+                expected_type=expected_type,
                 actual_type="missing",
-                message=f"Required input '{v['name']}' is missing from state"
+                message=f"Required input '{name}' is missing from state"
             ))
 
     return StateValidationResult(
@@ -62,6 +62,7 @@ sm_mod.state_manager = type("SM", (), {
     "is_connected": False, "nc": None,
     "connect": lambda s: None, "disconnect": lambda s: None,
 })()
+sm_mod.ValidationPlan = None
 sys.modules["state_manager"] = sm_mod
 
 # stream_manager.py
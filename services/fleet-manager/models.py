@@ -140,6 +140,9 @@ class EntityStateEvent(BaseModel):
     source: Optional[str]
     timestamp: datetime
 
+    class Config:
+        frozen = True
+
 
 class EntityLifecycleEvent(BaseModel):
     """Event emitted on entity create/update/delete"""
@@ -150,6 +153,9 @@ class EntityLifecycleEvent(BaseModel):
     data: Optional[Dict[str, Any]] = None
     timestamp: datetime
 
+    class Config:
+        frozen = True
+
 
 # =============================================================================
 # Variable Definition Models
@@ -175,46 +181,44 @@ class VariableDirection(str, Enum):
     OUTPUT = "output"
 
 
+# Plain string literals for model fields, derived from the enums so they stay in
+# step; validated by set lookup without the enum construct-then-unwrap round trip
+# of use_enum_values
+VariableTypeName = Literal[tuple(t.value for t in VariableType)]
+VariableDirectionName = Literal[tuple(d.value for d in VariableDirection)]
+
+
 class VariableDefinition(BaseModel):
     """Single variable definition for entity I/O"""
     name: str = Field(..., min_length=1, max_length=100, description="Variable name (maps to state key)")
-    type: VariableType = Field(..., description="Data type")
-    direction: VariableDirection = Field(..., description="Input or output")
+    type: VariableTypeName = Field(..., description="Data type")
+    direction: VariableDirectionName = Field(..., description="Input or output")
     description: Optional[str] = Field(None, max_length=500)
     defaultValue: Optional[Any] = Field(None, description="Default value")
     required: bool = Field(False, description="Whether this variable is required (inputs only)")
     config: Dict[str, Any] = Field(default_factory=dict, description="Type-specific configuration")
 
-    class Config:
-        use_enum_values = True
-
 
 class VariableDefinitionCreate(BaseModel):
     """Model for creating a variable definition"""
     name: str = Field(..., min_length=1, max_length=100)
-    type: VariableType
-    direction: VariableDirection
+    type: VariableTypeName
+    direction: VariableDirectionName
     description: Optional[str] = None
     defaultValue: Optional[Any] = None
     required: bool = False
     config: Optional[Dict[str, Any]] = None
 
-    class Config:
-        use_enum_values = True
-
 
 class VariableDefinitionUpdate(BaseModel):
     """Model for updating a variable definition"""
-    type: Optional[VariableType] = None
-    direction: Optional[VariableDirection] = None
+    type: Optional[VariableTypeName] = None
+    direction: Optional[VariableDirectionName] = None
     description: Optional[str] = None
     defaultValue: Optional[Any] = None
     required: Optional[bool] = None
     config: Optional[Dict[str, Any]] = None
 
-    class Config:
-        use_enum_values = True
-
 
 class EntityVariables(BaseModel):
     """Container for all entity variable definitions"""
@@ -295,6 +299,9 @@ class DeviceHeartbeat(BaseModel):
     status: str = DeviceStatus.ONLINE
     metadata: Optional[Dict[str, Any]] = None
 
+    class Config:
+        frozen = True
+
 
 class DeviceMetric(BaseModel):
     """Device metric data"""
@@ -304,6 +311,9 @@ class DeviceMetric(BaseModel):
     unit: Optional[str] = None
     tags: Optional[Dict[str, Any]] = None
 
+    class Config:
+        frozen = True
+
 
 class DeviceEvent(BaseModel):
     """Device event data"""
@@ -313,6 +323,9 @@ class DeviceEvent(BaseModel):
     message: Optional[str] = None
     data: Optional[Dict[str, Any]] = None
 
+    class Config:
+        frozen = True
+
 
 # =============================================================================
 # Device Discovery & Provisioning Models
@@ -572,12 +585,17 @@ class StreamProtocol(str, Enum):
     SHARED_MEMORY = "shared_memory"
 
 
+# Plain string literals for model fields, derived from the enums above
+StreamTypeName = Literal[tuple(t.value for t in StreamType)]
+StreamProtocolName = Literal[tuple(p.value for p in StreamProtocol)]
+
+
 class StreamAdvertise(BaseModel):
     """Request model for advertising a new stream"""
     name: str = Field(..., min_length=1, max_length=255)
-    stream_type: StreamType
+    stream_type: StreamTypeName
     publisher_id: str = Field(..., min_length=1, description="Unique ID of the publishing device/client")
-    protocol: StreamProtocol
+    protocol: StreamProtocolName
     address: str = Field(..., min_length=1, description="Publisher IP address or hostname")
     port: int = Field(..., ge=0, le=65535)
     entity_id: Optional[UUID] = None
@@ -601,9 +619,6 @@ class StreamAdvertise(BaseModel):
                 raise ValueError(f"Address {self.multicast_group} is not a valid multicast address (must be in 224.0.0.0/4)")
         return self
 
-    class Config:
-        use_enum_values = True
-
 
 class StreamInfo(BaseModel):
     """Full stream information returned from the registry"""
@@ -883,8 +898,3 @@ class CloudTestResult(BaseModel):
     error: Optional[str] = None
     checks: Dict[str, bool] = Field(default_factory=dict)
 
-
-# Enable forward references
-Entity.model_rebuild()
-EntityTreeNode.model_rebuild()
-RoutePresetDetail.model_rebuild()
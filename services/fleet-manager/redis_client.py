@@ -7,34 +7,57 @@ import os
 import redis.asyncio as redis
 
 REDIS_URL = os.getenv('REDIS_URL', 'redis://redis:6379')
+REDIS_MAX_CONNECTIONS = int(os.getenv('REDIS_MAX_CONNECTIONS', '64'))
+REDIS_HEALTH_CHECK_INTERVAL = int(os.getenv('REDIS_HEALTH_CHECK_INTERVAL', '30'))
+# Seconds a caller waits for a free pooled connection once all are checked out
+REDIS_POOL_TIMEOUT = float(os.getenv('REDIS_POOL_TIMEOUT', '5'))
 
 # Global async Redis connection pool
 _redis_pool: redis.Redis = None
+_connection_pool: redis.BlockingConnectionPool = None
 
 
 async def init_redis() -> bool:
     """Initialize async Redis connection pool"""
-    global _redis_pool
+    global _redis_pool, _connection_pool
     try:
-        _redis_pool = redis.from_url(REDIS_URL, decode_responses=True)
+        # Blocking pool: at the connection cap callers wait for a free connection
+        # instead of failing with "Too many connections"
+        _connection_pool = redis.BlockingConnectionPool.from_url(
+            REDIS_URL,
+            decode_responses=True,
+            max_connections=REDIS_MAX_CONNECTIONS,
+            timeout=REDIS_POOL_TIMEOUT,
+            health_check_interval=REDIS_HEALTH_CHECK_INTERVAL,
+            socket_keepalive=True,
+            retry_on_timeout=True,
+        )
+        _redis_pool = redis.Redis(connection_pool=_connection_pool)
         await _redis_pool.ping()
         print(f"✅ Redis connected: {REDIS_URL}")
         return True
     except Exception as e:
         print(f"⚠️ Redis connection failed: {e}")
+        if _connection_pool:
+            await _connection_pool.disconnect()
         _redis_pool = None
+        _connection_pool = None
         return False
 
 
 async def close_redis():
     """Close Redis connection pool"""
-    global _redis_pool
+    global _redis_pool, _connection_pool
     if _redis_pool:
         await _redis_pool.close()
+        # A pool passed in explicitly is not closed along with the client
+        await _connection_pool.disconnect()
         print("📴 Redis disconnected")
         _redis_pool = None
+        _connection_pool = None
 
 
 def get_redis() -> redis.Redis:
     """Get the Redis connection pool"""
     return _redis_pool
+
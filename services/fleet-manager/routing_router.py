@@ -3,14 +3,21 @@ Routing API Router
 Device routing, route management, and preset operations
 """
 
-from fastapi import APIRouter, HTTPException, Depends, Query
+from functools import lru_cache
+from operator import attrgetter
+
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete, func, update
-from typing import Optional, List
+from sqlalchemy.orm import joinedload
+from sqlalchemy import select, insert, delete, func, update, bindparam, literal
+from sqlalchemy.dialects.postgresql import UUID as PGUUID, insert as pg_insert
+from typing import Optional, List, Dict, Tuple
 from uuid import UUID
 from datetime import datetime
 
-from database import get_db, RoutingDeviceDB, RouteDB, RoutePresetDB
+from database import get_db, async_session_maker, RoutingDeviceDB, RouteDB, RoutePresetDB
 from models import (
     RoutingDevice, RoutingDeviceCreate, RoutingDeviceUpdate,
     Route, RouteCreate, RouteBulkUpdate,
@@ -20,33 +27,123 @@ from models import (
 
 router = APIRouter(prefix="/routing", tags=["routing"])
 
+# Serialize list and full-state payloads straight to JSON bytes in pydantic-core,
+# skipping FastAPI's dump-to-dict then json.dumps pass
+_routing_state_adapter = TypeAdapter(RoutingState)
+_device_adapter = TypeAdapter(RoutingDevice)
+_route_adapter = TypeAdapter(Route)
+_presets_adapter = TypeAdapter(List[RoutePreset])
+
 
 # =============================================================================
 # Helpers
 # =============================================================================
 
+# Static statements are built on first use and then reused; per-request values are
+# bound at execute time. Building them lazily keeps the module importable against
+# the stub models used by export_openapi.py.
+
+@lru_cache(maxsize=None)
+def _select_device_by_id():
+    return select(RoutingDeviceDB).where(RoutingDeviceDB.id == bindparam('device_id'))
+
+
+@lru_cache(maxsize=None)
+def _select_preset_by_id():
+    return select(RoutePresetDB).where(RoutePresetDB.id == bindparam('preset_id'))
+
+
+@lru_cache(maxsize=None)
+def _select_preset_with_routes():
+    return (
+        select(RoutePresetDB)
+        .options(joinedload(RoutePresetDB.routes))
+        .where(RoutePresetDB.id == bindparam('preset_id'))
+    )
+
+
+# List endpoints select plain columns so rows skip ORM identity-map bookkeeping;
+# the converters read rows and ORM instances through the same attribute names
+@lru_cache(maxsize=None)
+def _device_columns() -> tuple:
+    return (
+        RoutingDeviceDB.id, RoutingDeviceDB.name, RoutingDeviceDB.device_type,
+        RoutingDeviceDB.icon, RoutingDeviceDB.color, RoutingDeviceDB.inputs,
+        RoutingDeviceDB.outputs, RoutingDeviceDB.routing_metadata,
+        RoutingDeviceDB.position_x, RoutingDeviceDB.position_y, RoutingDeviceDB.sort_order,
+        RoutingDeviceDB.created_at, RoutingDeviceDB.updated_at,
+    )
+
+
+@lru_cache(maxsize=None)
+def _route_columns() -> tuple:
+    return (
+        RouteDB.id, RouteDB.from_device_id, RouteDB.from_port, RouteDB.to_device_id,
+        RouteDB.to_port, RouteDB.preset_id, RouteDB.route_metadata, RouteDB.created_at,
+    )
+
+
+@lru_cache(maxsize=None)
+def _select_devices_ordered():
+    return select(*_device_columns()).order_by(RoutingDeviceDB.sort_order, RoutingDeviceDB.name)
+
+
+@lru_cache(maxsize=None)
+def _select_active_routes():
+    return select(*_route_columns()).where(RouteDB.preset_id.is_(None))
+
+
+@lru_cache(maxsize=None)
+def _select_presets_with_counts():
+    # Per-preset route count as a correlated subquery, answered from idx_routes_preset
+    # without joining and grouping every route row
+    route_count = (
+        select(func.count(RouteDB.id))
+        .where(RouteDB.preset_id == RoutePresetDB.id)
+        .correlate(RoutePresetDB)
+        .scalar_subquery()
+    )
+    return (
+        select(RoutePresetDB, route_count.label('route_count'))
+        .order_by(RoutePresetDB.name)
+    )
+
+
+# Rows come from our own schema-constrained tables, so the converters below use
+# model_construct and skip per-field validation.
+
+_DEVICE_ATTRS = attrgetter(
+    'id', 'name', 'device_type', 'icon', 'color', 'inputs', 'outputs', 'routing_metadata',
+    'position_x', 'position_y', 'sort_order', 'created_at', 'updated_at',
+)
+
+
 def routing_device_db_to_response(db_device: RoutingDeviceDB) -> RoutingDevice:
     """Convert database model to response model"""
-    return RoutingDevice(
-        id=db_device.id,
-        name=db_device.name,
-        device_type=db_device.device_type,
-        icon=db_device.icon or '📦',
-        color=db_device.color or '#6C757D',
-        inputs=db_device.inputs or [],
-        outputs=db_device.outputs or [],
-        metadata=db_device.routing_metadata or {},
-        position_x=db_device.position_x or 0,
-        position_y=db_device.position_y or 0,
-        sort_order=db_device.sort_order or 0,
-        created_at=db_device.created_at or datetime.utcnow(),
-        updated_at=db_device.updated_at or datetime.utcnow(),
+    (
+        id_, name, device_type, icon, color, inputs, outputs, metadata,
+        position_x, position_y, sort_order, created_at, updated_at,
+    ) = _DEVICE_ATTRS(db_device)
+    return RoutingDevice.model_construct(
+        id=id_,
+        name=name,
+        device_type=device_type,
+        icon=icon or '📦',
+        color=color or '#6C757D',
+        inputs=inputs or [],
+        outputs=outputs or [],
+        metadata=metadata or {},
+        position_x=position_x or 0.0,
+        position_y=position_y or 0.0,
+        sort_order=sort_order or 0,
+        created_at=created_at or datetime.utcnow(),
+        updated_at=updated_at or datetime.utcnow(),
     )
 
 
 def route_db_to_response(db_route: RouteDB) -> Route:
     """Convert database model to response model"""
-    return Route(
+    return Route.model_construct(
         id=db_route.id,
         from_device_id=db_route.from_device_id,
         from_port=db_route.from_port,
@@ -60,7 +157,7 @@ def route_db_to_response(db_route: RouteDB) -> Route:
 
 def preset_db_to_response(db_preset: RoutePresetDB, route_count: int = 0) -> RoutePreset:
     """Convert database model to response model"""
-    return RoutePreset(
+    return RoutePreset.model_construct(
         id=db_preset.id,
         name=db_preset.name,
         description=db_preset.description,
@@ -72,6 +169,75 @@ def preset_db_to_response(db_preset: RoutePresetDB, route_count: int = 0) -> Rou
     )
 
 
+async def _load_device_ports(db: AsyncSession, device_ids) -> Dict[UUID, Tuple[frozenset, frozenset]]:
+    """Fetch (input ports, output ports) sets for the given devices in one query"""
+    result = await db.execute(
+        select(RoutingDeviceDB.id, RoutingDeviceDB.inputs, RoutingDeviceDB.outputs)
+        .where(RoutingDeviceDB.id.in_(device_ids))
+    )
+    return {
+        row.id: (frozenset(row.inputs or ()), frozenset(row.outputs or ()))
+        for row in result.all()
+    }
+
+
+def _validate_route_ports(route: RouteCreate, ports_by_id: Dict[UUID, Tuple[frozenset, frozenset]]):
+    """Raise if either device is missing or the ports are not on the device"""
+    for dev_id in [route.from_device_id, route.to_device_id]:
+        if dev_id not in ports_by_id:
+            raise HTTPException(status_code=404, detail=f"Routing device {dev_id} not found")
+
+    if route.from_port not in ports_by_id[route.from_device_id][1]:
+        raise HTTPException(status_code=400, detail=f"Port '{route.from_port}' not found on device outputs")
+
+    if route.to_port not in ports_by_id[route.to_device_id][0]:
+        raise HTTPException(status_code=400, detail=f"Port '{route.to_port}' not found on device inputs")
+
+
+def _json_response(adapter: TypeAdapter, value) -> Response:
+    """Serialize a response value with a prebuilt adapter, using field aliases like FastAPI"""
+    return Response(content=adapter.dump_json(value, by_alias=True), media_type="application/json")
+
+
+async def _stream_json_array(statement, convert, adapter: TypeAdapter, batch_size: int = 200):
+    """Yield a JSON array of converted rows, read through a server-side cursor"""
+    # Opens its own session: get_db's session is closed before a streaming body runs
+    async with async_session_maker() as session:
+        result = await session.stream(statement)
+        yield b'['
+        first = True
+        async for rows in result.partitions(batch_size):
+            chunk = b','.join(adapter.dump_json(convert(row), by_alias=True) for row in rows)
+            yield chunk if first else b',' + chunk
+            first = False
+        yield b']'
+
+
+def _copy_routes(from_preset_id: Optional[UUID], to_preset_id: Optional[UUID]):
+    """Build an INSERT ... SELECT copying routes between the active table and a preset"""
+    source = (
+        RouteDB.preset_id.is_(None) if from_preset_id is None
+        else RouteDB.preset_id == from_preset_id
+    )
+    # include_defaults=False leaves id/created_at to the column server defaults;
+    # the Python-side uuid4 default would otherwise be evaluated once per statement
+    return insert(RouteDB).from_select(
+        [
+            RouteDB.from_device_id, RouteDB.from_port, RouteDB.to_device_id,
+            RouteDB.to_port, RouteDB.preset_id, RouteDB.route_metadata,
+        ],
+        select(
+            RouteDB.from_device_id,
+            RouteDB.from_port,
+            RouteDB.to_device_id,
+            RouteDB.to_port,
+            literal(to_preset_id, PGUUID(as_uuid=True)),
+            RouteDB.route_metadata,
+        ).where(source),
+        include_defaults=False
+    )
+
+
 # =============================================================================
 # Full State Endpoint (single fetch for frontend)
 # =============================================================================
@@ -79,31 +245,23 @@ def preset_db_to_response(db_preset: RoutePresetDB, route_count: int = 0) -> Rou
 @router.get("/state", response_model=RoutingState)
 async def get_routing_state(db: AsyncSession = Depends(get_db)):
     """Get complete routing state: all devices, active routes, and presets"""
+    # One REPEATABLE READ transaction so all three reads see the same snapshot
+    await db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+
     # Devices
-    result = await db.execute(
-        select(RoutingDeviceDB).order_by(RoutingDeviceDB.sort_order, RoutingDeviceDB.name)
-    )
-    devices = [routing_device_db_to_response(d) for d in result.scalars().all()]
+    result = await db.execute(_select_devices_ordered())
+    devices = [routing_device_db_to_response(d) for d in result.all()]
 
     # Active routes (preset_id IS NULL)
-    result = await db.execute(
-        select(RouteDB).where(RouteDB.preset_id.is_(None))
-    )
-    routes = [route_db_to_response(r) for r in result.scalars().all()]
+    result = await db.execute(_select_active_routes())
+    routes = [route_db_to_response(r) for r in result.all()]
 
     # Presets with route counts
-    result = await db.execute(
-        select(
-            RoutePresetDB,
-            func.count(RouteDB.id).label('route_count')
-        )
-        .outerjoin(RouteDB, RouteDB.preset_id == RoutePresetDB.id)
-        .group_by(RoutePresetDB.id)
-        .order_by(RoutePresetDB.name)
-    )
+    result = await db.execute(_select_presets_with_counts())
     presets = [preset_db_to_response(p, rc) for p, rc in result.all()]
 
-    return RoutingState(devices=devices, routes=routes, presets=presets)
+    state = RoutingState(devices=devices, routes=routes, presets=presets)
+    return _json_response(_routing_state_adapter, state)
 
 
 # =============================================================================
@@ -115,25 +273,24 @@ async def list_routing_devices(
     device_type: Optional[str] = Query(None),
     limit: int = Query(100, ge=1, le=500),
     offset: int = Query(0, ge=0),
-    db: AsyncSession = Depends(get_db)
 ):
     """List routing devices"""
-    query = select(RoutingDeviceDB)
+    query = select(*_device_columns())
 
     if device_type:
         query = query.where(RoutingDeviceDB.device_type == device_type)
 
     query = query.order_by(RoutingDeviceDB.sort_order, RoutingDeviceDB.name).limit(limit).offset(offset)
-    result = await db.execute(query)
-    return [routing_device_db_to_response(d) for d in result.scalars().all()]
+    return StreamingResponse(
+        _stream_json_array(query, routing_device_db_to_response, _device_adapter),
+        media_type="application/json",
+    )
 
 
 @router.get("/devices/{device_id}", response_model=RoutingDevice)
 async def get_routing_device(device_id: UUID, db: AsyncSession = Depends(get_db)):
     """Get a routing device by ID"""
-    result = await db.execute(
-        select(RoutingDeviceDB).where(RoutingDeviceDB.id == device_id)
-    )
+    result = await db.execute(_select_device_by_id(), {"device_id": device_id})
     db_device = result.scalar_one_or_none()
     if not db_device:
         raise HTTPException(status_code=404, detail="Routing device not found")
@@ -171,9 +328,7 @@ async def update_routing_device(
     db: AsyncSession = Depends(get_db)
 ):
     """Update a routing device"""
-    result = await db.execute(
-        select(RoutingDeviceDB).where(RoutingDeviceDB.id == device_id)
-    )
+    result = await db.execute(_select_device_by_id(), {"device_id": device_id})
     db_device = result.scalar_one_or_none()
     if not db_device:
         raise HTTPException(status_code=404, detail="Routing device not found")
@@ -196,12 +351,13 @@ async def update_routing_device(
 async def delete_routing_device(device_id: UUID, db: AsyncSession = Depends(get_db)):
     """Delete a routing device and its routes"""
     result = await db.execute(
-        select(RoutingDeviceDB).where(RoutingDeviceDB.id == device_id)
+        delete(RoutingDeviceDB)
+        .where(RoutingDeviceDB.id == device_id)
+        .returning(RoutingDeviceDB.id)
     )
-    if not result.scalar_one_or_none():
+    if result.first() is None:
         raise HTTPException(status_code=404, detail="Routing device not found")
 
-    await db.execute(delete(RoutingDeviceDB).where(RoutingDeviceDB.id == device_id))
     await db.commit()
     return {"status": "deleted", "device_id": str(device_id)}
 
@@ -212,12 +368,18 @@ async def update_device_positions(
     db: AsyncSession = Depends(get_db)
 ):
     """Batch update device node graph positions. Expects {device_id: {x, y}}"""
-    for device_id_str, pos in positions.items():
-        device_id = UUID(device_id_str)
+    params = [
+        {"b_id": UUID(device_id_str), "b_x": pos.get('x', 0), "b_y": pos.get('y', 0)}
+        for device_id_str, pos in positions.items()
+    ]
+    if params:
+        # One executemany round-trip instead of an UPDATE per device
+        devices_table = RoutingDeviceDB.__table__
         await db.execute(
-            update(RoutingDeviceDB)
-            .where(RoutingDeviceDB.id == device_id)
-            .values(position_x=pos.get('x', 0), position_y=pos.get('y', 0))
+            update(devices_table)
+            .where(devices_table.c.id == bindparam('b_id'))
+            .values(position_x=bindparam('b_x'), position_y=bindparam('b_y')),
+            params
         )
     await db.commit()
     return {"status": "ok", "updated": len(positions)}
@@ -231,18 +393,19 @@ async def update_device_positions(
 async def list_routes(
     preset_id: Optional[UUID] = Query(None, description="Filter by preset; omit for active routes"),
     active_only: bool = Query(True, description="Only return active (non-preset) routes"),
-    db: AsyncSession = Depends(get_db)
 ):
     """List routes"""
-    query = select(RouteDB)
+    query = select(*_route_columns())
 
     if preset_id:
         query = query.where(RouteDB.preset_id == preset_id)
     elif active_only:
         query = query.where(RouteDB.preset_id.is_(None))
 
-    result = await db.execute(query)
-    return [route_db_to_response(r) for r in result.scalars().all()]
+    return StreamingResponse(
+        _stream_json_array(query, route_db_to_response, _route_adapter),
+        media_type="application/json",
+    )
 
 
 @router.post("/routes", response_model=Route, status_code=201)
@@ -251,63 +414,42 @@ async def create_route(
     db: AsyncSession = Depends(get_db)
 ):
     """Create a single route"""
-    # Validate devices exist
-    for dev_id in [route.from_device_id, route.to_device_id]:
-        result = await db.execute(
-            select(RoutingDeviceDB).where(RoutingDeviceDB.id == dev_id)
-        )
-        if not result.scalar_one_or_none():
-            raise HTTPException(status_code=404, detail=f"Routing device {dev_id} not found")
-
-    # Validate ports exist on devices
-    from_result = await db.execute(
-        select(RoutingDeviceDB).where(RoutingDeviceDB.id == route.from_device_id)
-    )
-    from_device = from_result.scalar_one()
-    if route.from_port not in (from_device.outputs or []):
-        raise HTTPException(status_code=400, detail=f"Port '{route.from_port}' not found on device outputs")
-
-    to_result = await db.execute(
-        select(RoutingDeviceDB).where(RoutingDeviceDB.id == route.to_device_id)
-    )
-    to_device = to_result.scalar_one()
-    if route.to_port not in (to_device.inputs or []):
-        raise HTTPException(status_code=400, detail=f"Port '{route.to_port}' not found on device inputs")
+    ports_by_id = await _load_device_ports(db, [route.from_device_id, route.to_device_id])
+    _validate_route_ports(route, ports_by_id)
 
-    # Check for duplicate
+    # Insert, letting idx_routes_active_connection reject duplicates
     result = await db.execute(
-        select(RouteDB).where(
-            RouteDB.from_device_id == route.from_device_id,
-            RouteDB.from_port == route.from_port,
-            RouteDB.to_device_id == route.to_device_id,
-            RouteDB.to_port == route.to_port,
-            RouteDB.preset_id.is_(None),
+        pg_insert(RouteDB)
+        .values(
+            from_device_id=route.from_device_id,
+            from_port=route.from_port,
+            to_device_id=route.to_device_id,
+            to_port=route.to_port,
+            route_metadata=route.metadata,
         )
+        .on_conflict_do_nothing(
+            index_elements=['from_device_id', 'from_port', 'to_device_id', 'to_port'],
+            index_where=RouteDB.preset_id.is_(None),
+        )
+        .returning(RouteDB)
     )
-    if result.scalar_one_or_none():
+    db_route = result.scalar_one_or_none()
+    if not db_route:
         raise HTTPException(status_code=409, detail="Route already exists")
 
-    db_route = RouteDB(
-        from_device_id=route.from_device_id,
-        from_port=route.from_port,
-        to_device_id=route.to_device_id,
-        to_port=route.to_port,
-        route_metadata=route.metadata,
-    )
-    db.add(db_route)
     await db.commit()
-    await db.refresh(db_route)
     return route_db_to_response(db_route)
 
 
 @router.delete("/routes/{route_id}")
 async def delete_route(route_id: UUID, db: AsyncSession = Depends(get_db)):
     """Delete a route by ID"""
-    result = await db.execute(select(RouteDB).where(RouteDB.id == route_id))
-    if not result.scalar_one_or_none():
+    result = await db.execute(
+        delete(RouteDB).where(RouteDB.id == route_id).returning(RouteDB.id)
+    )
+    if result.first() is None:
         raise HTTPException(status_code=404, detail="Route not found")
 
-    await db.execute(delete(RouteDB).where(RouteDB.id == route_id))
     await db.commit()
     return {"status": "deleted", "route_id": str(route_id)}
 
@@ -322,19 +464,19 @@ async def delete_route_by_ports(
 ):
     """Delete a route by its from/to device+port combination"""
     result = await db.execute(
-        select(RouteDB).where(
+        delete(RouteDB)
+        .where(
             RouteDB.from_device_id == from_device_id,
             RouteDB.from_port == from_port,
             RouteDB.to_device_id == to_device_id,
             RouteDB.to_port == to_port,
             RouteDB.preset_id.is_(None),
         )
+        .returning(RouteDB.id)
     )
-    db_route = result.scalar_one_or_none()
-    if not db_route:
+    if result.first() is None:
         raise HTTPException(status_code=404, detail="Route not found")
 
-    await db.execute(delete(RouteDB).where(RouteDB.id == db_route.id))
     await db.commit()
     return {"status": "deleted"}
 
@@ -345,28 +487,44 @@ async def replace_all_routes(
     db: AsyncSession = Depends(get_db)
 ):
     """Replace all active routes with a new set"""
+    # Collapse repeated connections to their first occurrence, since
+    # idx_routes_active_connection would reject the whole insert
+    unique_routes = {}
+    for route in bulk.routes:
+        key = (route.from_device_id, route.from_port, route.to_device_id, route.to_port)
+        unique_routes.setdefault(key, route)
+    routes = list(unique_routes.values())
+
+    # Validate every route against one fetch of the referenced devices
+    device_ids = {r.from_device_id for r in routes} | {r.to_device_id for r in routes}
+    if device_ids:
+        ports_by_id = await _load_device_ports(db, device_ids)
+        for route in routes:
+            _validate_route_ports(route, ports_by_id)
+
     # Delete all active routes
     await db.execute(delete(RouteDB).where(RouteDB.preset_id.is_(None)))
 
-    # Insert new routes
+    # Insert new routes in one statement, returning the generated rows
     new_routes = []
-    for route in bulk.routes:
-        db_route = RouteDB(
-            from_device_id=route.from_device_id,
-            from_port=route.from_port,
-            to_device_id=route.to_device_id,
-            to_port=route.to_port,
-            route_metadata=route.metadata,
+    if routes:
+        result = await db.execute(
+            insert(RouteDB).returning(RouteDB, sort_by_parameter_order=True),
+            [
+                {
+                    "from_device_id": route.from_device_id,
+                    "from_port": route.from_port,
+                    "to_device_id": route.to_device_id,
+                    "to_port": route.to_port,
+                    "route_metadata": route.metadata,
+                }
+                for route in routes
+            ]
         )
-        db.add(db_route)
-        new_routes.append(db_route)
+        new_routes = result.scalars().all()
 
     await db.commit()
 
-    # Refresh all to get generated IDs
-    for r in new_routes:
-        await db.refresh(r)
-
     return [route_db_to_response(r) for r in new_routes]
 
 
@@ -387,34 +545,21 @@ async def clear_all_routes(db: AsyncSession = Depends(get_db)):
 @router.get("/presets", response_model=List[RoutePreset])
 async def list_presets(db: AsyncSession = Depends(get_db)):
     """List all route presets"""
-    result = await db.execute(
-        select(
-            RoutePresetDB,
-            func.count(RouteDB.id).label('route_count')
-        )
-        .outerjoin(RouteDB, RouteDB.preset_id == RoutePresetDB.id)
-        .group_by(RoutePresetDB.id)
-        .order_by(RoutePresetDB.name)
-    )
-    return [preset_db_to_response(p, rc) for p, rc in result.all()]
+    result = await db.execute(_select_presets_with_counts())
+    return _json_response(_presets_adapter, [preset_db_to_response(p, rc) for p, rc in result.all()])
 
 
 @router.get("/presets/{preset_id}", response_model=RoutePresetDetail)
 async def get_preset(preset_id: UUID, db: AsyncSession = Depends(get_db)):
     """Get a preset with its routes"""
-    result = await db.execute(
-        select(RoutePresetDB).where(RoutePresetDB.id == preset_id)
-    )
-    db_preset = result.scalar_one_or_none()
+    result = await db.execute(_select_preset_with_routes(), {"preset_id": preset_id})
+    db_preset = result.unique().scalar_one_or_none()
     if not db_preset:
         raise HTTPException(status_code=404, detail="Preset not found")
 
-    result = await db.execute(
-        select(RouteDB).where(RouteDB.preset_id == preset_id)
-    )
-    routes = [route_db_to_response(r) for r in result.scalars().all()]
+    routes = [route_db_to_response(r) for r in db_preset.routes]
 
-    return RoutePresetDetail(
+    return RoutePresetDetail.model_construct(
         id=db_preset.id,
         name=db_preset.name,
         description=db_preset.description,
@@ -458,9 +603,7 @@ async def update_preset(
     db: AsyncSession = Depends(get_db)
 ):
     """Update preset metadata"""
-    result = await db.execute(
-        select(RoutePresetDB).where(RoutePresetDB.id == preset_id)
-    )
+    result = await db.execute(_select_preset_by_id(), {"preset_id": preset_id})
     db_preset = result.scalar_one_or_none()
     if not db_preset:
         raise HTTPException(status_code=404, detail="Preset not found")
@@ -488,12 +631,13 @@ async def update_preset(
 async def delete_preset(preset_id: UUID, db: AsyncSession = Depends(get_db)):
     """Delete a preset and all its routes"""
     result = await db.execute(
-        select(RoutePresetDB).where(RoutePresetDB.id == preset_id)
+        delete(RoutePresetDB)
+        .where(RoutePresetDB.id == preset_id)
+        .returning(RoutePresetDB.id)
     )
-    if not result.scalar_one_or_none():
+    if result.first() is None:
         raise HTTPException(status_code=404, detail="Preset not found")
 
-    await db.execute(delete(RoutePresetDB).where(RoutePresetDB.id == preset_id))
     await db.commit()
     return {"status": "deleted", "preset_id": str(preset_id)}
 
@@ -504,9 +648,7 @@ async def save_current_to_preset(
     db: AsyncSession = Depends(get_db)
 ):
     """Save the current active routing table into a preset (snapshot)"""
-    result = await db.execute(
-        select(RoutePresetDB).where(RoutePresetDB.id == preset_id)
-    )
+    result = await db.execute(_select_preset_by_id(), {"preset_id": preset_id})
     db_preset = result.scalar_one_or_none()
     if not db_preset:
         raise HTTPException(status_code=404, detail="Preset not found")
@@ -514,24 +656,13 @@ async def save_current_to_preset(
     # Delete existing preset routes
     await db.execute(delete(RouteDB).where(RouteDB.preset_id == preset_id))
 
-    # Copy active routes into this preset
+    # Copy active routes into this preset server-side
     result = await db.execute(
-        select(RouteDB).where(RouteDB.preset_id.is_(None))
+        _copy_routes(from_preset_id=None, to_preset_id=preset_id)
     )
-    active_routes = result.scalars().all()
-
-    for r in active_routes:
-        db.add(RouteDB(
-            from_device_id=r.from_device_id,
-            from_port=r.from_port,
-            to_device_id=r.to_device_id,
-            to_port=r.to_port,
-            preset_id=preset_id,
-            route_metadata=r.route_metadata,
-        ))
 
     await db.commit()
-    return {"status": "saved", "route_count": len(active_routes)}
+    return {"status": "saved", "route_count": result.rowcount}
 
 
 @router.post("/presets/{preset_id}/recall")
@@ -540,9 +671,7 @@ async def recall_preset(
     db: AsyncSession = Depends(get_db)
 ):
     """Load a preset as the active routing table (replaces current routes)"""
-    result = await db.execute(
-        select(RoutePresetDB).where(RoutePresetDB.id == preset_id)
-    )
+    result = await db.execute(_select_preset_by_id(), {"preset_id": preset_id})
     db_preset = result.scalar_one_or_none()
     if not db_preset:
         raise HTTPException(status_code=404, detail="Preset not found")
@@ -550,30 +679,18 @@ async def recall_preset(
     # Clear all active routes
     await db.execute(delete(RouteDB).where(RouteDB.preset_id.is_(None)))
 
-    # Copy preset routes as active
+    # Copy preset routes as active server-side
     result = await db.execute(
-        select(RouteDB).where(RouteDB.preset_id == preset_id)
+        _copy_routes(from_preset_id=preset_id, to_preset_id=None)
     )
-    preset_routes = result.scalars().all()
-
-    new_routes = []
-    for r in preset_routes:
-        new_route = RouteDB(
-            from_device_id=r.from_device_id,
-            from_port=r.from_port,
-            to_device_id=r.to_device_id,
-            to_port=r.to_port,
-            preset_id=None,  # Active table
-            route_metadata=r.route_metadata,
-        )
-        db.add(new_route)
-        new_routes.append(new_route)
+    route_count = result.rowcount
 
-    # Mark this preset as active, clear others
+    # Mark this preset as active and clear others in one statement
     await db.execute(
-        update(RoutePresetDB).values(is_active=False)
+        update(RoutePresetDB)
+        .values(is_active=(RoutePresetDB.id == preset_id))
+        .execution_options(synchronize_session=False)
     )
-    db_preset.is_active = True
 
     await db.commit()
-    return {"status": "recalled", "preset_name": db_preset.name, "route_count": len(new_routes)}
+    return {"status": "recalled", "preset_name": db_preset.name, "route_count": route_count}
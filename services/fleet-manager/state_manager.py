@@ -5,9 +5,10 @@ Also processes incoming MQTT state update commands from devices (Arduino, ESP32,
 """
 
 import json
+from functools import lru_cache
 import asyncio
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, Any, List, Optional, Callable
 from uuid import UUID
 import os
@@ -15,6 +16,7 @@ import os
 import nats
 from nats.aio.client import Client as NATS
 import paho.mqtt.client as mqtt
+from pydantic_core import to_json
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +24,91 @@ logger = logging.getLogger(__name__)
 # can schedule coroutines on the main loop.
 _loop: Optional[asyncio.AbstractEventLoop] = None
 
+MQTT_STATE_PREFIX = "maestra/entity/state/"
+
+# Outgoing NATS buffer; publishes only wait on a forced flush past this size
+NATS_PENDING_SIZE = int(os.getenv('NATS_PENDING_SIZE', str(8 * 1024 * 1024)))
+NATS_FLUSHER_QUEUE_SIZE = 2048
+
+# Bound on queued outbound MQTT publishes before new ones are dropped
+MQTT_PUBLISH_QUEUE_SIZE = int(os.getenv('MQTT_PUBLISH_QUEUE_SIZE', '10000'))
+
+# QoS for state change publishes; 0 skips the PUBACK round-trip since each
+# state event supersedes the last. Lifecycle events always use QoS 1.
+MQTT_STATE_QOS = int(os.getenv('MQTT_STATE_QOS', '1'))
+
+# Incoming MQTT state commands are queued for a fixed pool of handler workers
+MQTT_INGRESS_QUEUE_SIZE = int(os.getenv('MQTT_INGRESS_QUEUE_SIZE', '50000'))
+MQTT_INGRESS_WORKERS = int(os.getenv('MQTT_INGRESS_WORKERS', '4'))
+
+
+def _encode_event(event: Dict[str, Any]) -> bytes:
+    """Serialize an event to compact JSON bytes (UUIDs and UTC datetimes as ...Z natively).
+
+    Events are serialized once and the same bytes are handed to both the
+    NATS and MQTT publishers.
+    """
+    return to_json(event, serialize_unknown=True)
+
+
+@lru_cache(maxsize=4096)
+def _state_routes(entity_type: str, slug: str) -> tuple:
+    """NATS subjects and MQTT topic for an entity's state changes"""
+    return (
+        f"maestra.entity.state.{entity_type}.{slug}",
+        f"maestra.entity.state.{entity_type}",
+        f"maestra/entity/state/{entity_type}/{slug}",
+    )
+
+
+@lru_cache(maxsize=4096)
+def _lifecycle_routes(event_type: str, entity_type: str, slug: str) -> tuple:
+    """NATS subjects and MQTT topic for an entity lifecycle event"""
+    return (
+        f"maestra.entity.{event_type}.{entity_type}.{slug}",
+        f"maestra.entity.{event_type}",
+        f"maestra/entity/{event_type}/{entity_type}/{slug}",
+    )
+
+
+def _accept_any(value: Any) -> bool:
+    return True
+
+
+# Variable type checks, built once at import rather than per validated value
+VARIABLE_TYPE_CHECKS: Dict[str, Callable[[Any], bool]] = {
+    "string": lambda v: isinstance(v, str),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "boolean": lambda v: isinstance(v, bool),
+    "array": lambda v: isinstance(v, list),
+    "color": lambda v: isinstance(v, str),
+    "vector2": lambda v: isinstance(v, dict) and "x" in v and "y" in v,
+    "vector3": lambda v: isinstance(v, dict) and "x" in v and "y" in v and "z" in v,
+    "range": lambda v: isinstance(v, (int, float)),
+    "enum": _accept_any,
+    "object": lambda v: isinstance(v, dict),
+}
+
+
+class ValidationPlan:
+    """Variable definitions compiled into per-key checks and required inputs"""
+
+    __slots__ = ("checks", "required")
+
+    def __init__(self, variables: Dict[str, Any]):
+        inputs = variables.get("inputs", [])
+        outputs = variables.get("outputs", [])
+        self.checks: Dict[str, tuple] = {}
+        for v in inputs + outputs:
+            expected_type = v.get("type", "string")
+            self.checks[v["name"]] = (
+                expected_type,
+                VARIABLE_TYPE_CHECKS.get(expected_type, _accept_any),
+            )
+        self.required = tuple(
+            (v["name"], v.get("type", "string")) for v in inputs if v.get("required")
+        )
+
 
 class StateManager:
     """
@@ -38,10 +125,26 @@ class StateManager:
         self.nats_url = nats_url or os.getenv('NATS_URL', 'nats://nats:4222')
         self.mqtt_broker = mqtt_broker or os.getenv('MQTT_BROKER', 'mosquitto')
         self.mqtt_port = mqtt_port
+        # "delta" ships only the changed keys instead of both full states
+        self.state_event_format = os.getenv('STATE_EVENT_FORMAT', 'full')
+        # Window in seconds for merging rapid changes to one entity (0 disables)
+        self.state_coalesce_window = float(os.getenv('STATE_COALESCE_MS', '0')) / 1000
+        self._pending_state_changes: Dict[UUID, list] = {}
+        self._coalesce_tasks: set = set()
         self.nc: Optional[NATS] = None
+        # Set on connect and cleared on close so publishes check a plain flag
+        self._nats_up = False
         self.mqtt_client: Optional[mqtt.Client] = None
         self._connected = False
         self._message_handlers: List[Callable] = []
+        # Outbound MQTT publishes are queued and written by a single task
+        self._mqtt_out: Optional[asyncio.Queue] = None
+        self._mqtt_writer_task: Optional[asyncio.Task] = None
+        self.mqtt_dropped = 0
+        # Incoming MQTT commands, fed from the paho thread and drained by workers
+        self._ingress_q: Optional[asyncio.Queue] = None
+        self._ingress_workers: List[asyncio.Task] = []
+        self.mqtt_ingress_dropped = 0
 
     async def connect(self) -> bool:
         """Connect to NATS and MQTT brokers"""
@@ -51,13 +154,27 @@ class StateManager:
 
         # Connect to NATS
         try:
-            self.nc = await nats.connect(self.nats_url)
+            self.nc = await nats.connect(
+                self.nats_url,
+                error_cb=self._on_nats_error,
+                closed_cb=self._on_nats_closed,
+                pending_size=NATS_PENDING_SIZE,
+                flusher_queue_size=NATS_FLUSHER_QUEUE_SIZE,
+            )
+            self._nats_up = True
             print(f"✅ NATS connected: {self.nats_url}")
         except Exception as e:
             print(f"⚠️ NATS connection failed: {e}")
             self.nc = None
             success = False
 
+        # Start ingress workers before MQTT can deliver any messages
+        self._ingress_q = asyncio.Queue(maxsize=MQTT_INGRESS_QUEUE_SIZE)
+        self._ingress_workers = [
+            asyncio.create_task(self._ingress_worker())
+            for _ in range(MQTT_INGRESS_WORKERS)
+        ]
+
         # Connect to MQTT
         try:
             self.mqtt_client = mqtt.Client(
@@ -69,6 +186,8 @@ class StateManager:
             self.mqtt_client.on_message = self._on_mqtt_message
             self.mqtt_client.connect_async(self.mqtt_broker, self.mqtt_port)
             self.mqtt_client.loop_start()
+            self._mqtt_out = asyncio.Queue(maxsize=MQTT_PUBLISH_QUEUE_SIZE)
+            self._mqtt_writer_task = asyncio.create_task(self._mqtt_writer())
             print(f"✅ MQTT connecting: {self.mqtt_broker}:{self.mqtt_port}")
         except Exception as e:
             print(f"⚠️ MQTT connection failed: {e}")
@@ -99,13 +218,88 @@ class StateManager:
             await self.nc.close()
             print("📴 NATS disconnected")
 
+        if self._mqtt_writer_task:
+            self._mqtt_writer_task.cancel()
+            try:
+                await self._mqtt_writer_task
+            except asyncio.CancelledError:
+                pass
+            self._mqtt_writer_task = None
+
         if self.mqtt_client:
             self.mqtt_client.loop_stop()
             self.mqtt_client.disconnect()
             print("📴 MQTT disconnected")
 
+        for worker in self._ingress_workers:
+            worker.cancel()
+        await asyncio.gather(*self._ingress_workers, return_exceptions=True)
+        self._ingress_workers = []
+
         self._connected = False
 
+    async def _on_nats_error(self, e):
+        logger.error(f"NATS error: {e}")
+
+    async def _on_nats_closed(self):
+        # Only a closed client stops publishes; while reconnecting they go to
+        # the client's pending buffer and are flushed once the link is back
+        self._nats_up = False
+
+    async def _mqtt_writer(self):
+        """Drain the outbound queue into the MQTT client"""
+        queue = self._mqtt_out
+        publish = self.mqtt_client.publish
+        while True:
+            topic, payload, qos = await queue.get()
+            try:
+                publish(topic, payload, qos=qos)
+            except Exception as e:
+                print(f"⚠️ MQTT publish error: {e}")
+
+    def _enqueue_mqtt(self, topic: str, payload: bytes, qos: int = 1):
+        """Queue an MQTT publish, dropping it if the writer has fallen behind"""
+        try:
+            self._mqtt_out.put_nowait((topic, payload, qos))
+        except asyncio.QueueFull:
+            self.mqtt_dropped += 1
+            if self.mqtt_dropped % 1000 == 1:
+                logger.warning(f"MQTT publish queue full, {self.mqtt_dropped} messages dropped")
+
+    def _put_ingress(self, item: tuple):
+        """Queue an incoming command on the event loop, dropping it when full"""
+        try:
+            self._ingress_q.put_nowait(item)
+        except asyncio.QueueFull:
+            self.mqtt_ingress_dropped += 1
+            if self.mqtt_ingress_dropped % 1000 == 1:
+                logger.warning(f"MQTT ingress queue full, {self.mqtt_ingress_dropped} messages dropped")
+
+    async def _ingress_worker(self):
+        """Parse queued incoming MQTT messages and run the message handlers"""
+        queue = self._ingress_q
+        handlers = self._message_handlers
+        while True:
+            topic, raw = await queue.get()
+            try:
+                # Extract operation and slug from topic
+                # Format: maestra/entity/state/update/<slug> or maestra/entity/state/set/<slug>
+                operation, _, rest = topic[len(MQTT_STATE_PREFIX):].partition('/')
+                slug = rest.partition('/')[0]
+                if not slug:
+                    continue
+                # json.loads accepts the raw bytes, no intermediate str needed
+                payload = json.loads(raw)
+            except Exception as e:
+                print(f"⚠️ Error processing MQTT message: {e}")
+                continue
+
+            for handler in handlers:
+                try:
+                    await handler(operation, slug, payload)
+                except Exception as e:
+                    logger.error(f"MQTT message handler error for '{slug}': {e}")
+
     def _on_mqtt_connect(self, client, userdata, flags, reason_code, properties=None):
         """MQTT connection callback"""
         if reason_code == 0:
@@ -119,28 +313,15 @@ class StateManager:
     def _on_mqtt_message(self, client, userdata, msg):
         """Handle incoming MQTT messages (state update requests).
 
-        This runs on the paho-mqtt network thread, so we schedule
-        coroutines on the main asyncio loop via call_soon_threadsafe.
+        This runs on the paho-mqtt network thread, so it only forwards the raw
+        topic and payload to the main asyncio loop via call_soon_threadsafe;
+        parsing and dispatch happen in the ingress workers.
         """
-        try:
-            topic = msg.topic
-            payload = json.loads(msg.payload.decode())
-
-            # Extract operation and slug from topic
-            # Format: maestra/entity/state/update/<slug> or maestra/entity/state/set/<slug>
-            parts = topic.split('/')
-            if len(parts) >= 5:
-                operation = parts[3]  # "update" or "set"
-                slug = parts[4]
-
-                # Schedule async handlers on the main event loop
-                if _loop and not _loop.is_closed():
-                    for handler in self._message_handlers:
-                        asyncio.run_coroutine_threadsafe(
-                            handler(operation, slug, payload), _loop
-                        )
-        except Exception as e:
-            print(f"⚠️ Error processing MQTT message: {e}")
+        topic = msg.topic
+        if not topic.startswith(MQTT_STATE_PREFIX):
+            return
+        if _loop and not _loop.is_closed():
+            _loop.call_soon_threadsafe(self._put_ingress, (topic, msg.payload))
 
     def add_message_handler(self, handler: Callable):
         """Add a handler for incoming state update requests"""
@@ -150,7 +331,7 @@ class StateManager:
         """Handle NATS state update command: maestra.entity.state.update.<slug>"""
         try:
             slug = msg.subject.split('.')[-1]
-            payload = json.loads(msg.data.decode())
+            payload = json.loads(msg.data)
             await self._handle_mqtt_state_update("update", slug, payload)
         except Exception as e:
             logger.error(f"NATS state update error: {e}")
@@ -159,7 +340,7 @@ class StateManager:
         """Handle NATS state set command: maestra.entity.state.set.<slug>"""
         try:
             slug = msg.subject.split('.')[-1]
-            payload = json.loads(msg.data.decode())
+            payload = json.loads(msg.data)
             await self._handle_mqtt_state_update("set", slug, payload)
         except Exception as e:
             logger.error(f"NATS state set error: {e}")
@@ -277,29 +458,20 @@ class StateManager:
         current: Dict[str, Any]
     ) -> List[str]:
         """Compute which top-level keys changed between states"""
-        changed = []
-        all_keys = set(previous.keys()) | set(current.keys())
-        for key in all_keys:
-            if previous.get(key) != current.get(key):
-                changed.append(key)
+        if previous is current:
+            return []
+        previous_keys, current_keys = previous.keys(), current.keys()
+        changed = list(previous_keys ^ current_keys)
+        changed.extend(
+            key for key in previous_keys & current_keys
+            if previous[key] != current[key]
+        )
         return changed
 
     @staticmethod
     def _check_type(value: Any, expected_type: str) -> bool:
         """Check if a value matches the expected variable type"""
-        type_checks = {
-            "string": lambda v: isinstance(v, str),
-            "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
-            "boolean": lambda v: isinstance(v, bool),
-            "array": lambda v: isinstance(v, list),
-            "color": lambda v: isinstance(v, str),
-            "vector2": lambda v: isinstance(v, dict) and "x" in v and "y" in v,
-            "vector3": lambda v: isinstance(v, dict) and "x" in v and "y" in v and "z" in v,
-            "range": lambda v: isinstance(v, (int, float)),
-            "enum": lambda v: True,
-            "object": lambda v: isinstance(v, dict),
-        }
-        return type_checks.get(expected_type, lambda v: True)(value)
+        return VARIABLE_TYPE_CHECKS.get(expected_type, _accept_any)(value)
 
     def validate_state_against_variables(
         self,
@@ -311,33 +483,31 @@ class StateManager:
         Returns list of warnings (non-blocking).
         """
         warnings = []
-        inputs = variables.get("inputs", [])
-        outputs = variables.get("outputs", [])
-        all_vars = {v["name"]: v for v in inputs + outputs}
+        plan = ValidationPlan(variables)
+        checks = plan.checks
 
         # Check each state key against definitions
         for key, value in state.items():
-            if key in all_vars:
-                var_def = all_vars[key]
-                expected_type = var_def.get("type", "string")
-                if not self._check_type(value, expected_type):
-                    actual_type = type(value).__name__
-                    warnings.append({
-                        "variable_name": key,
-                        "expected_type": expected_type,
-                        "actual_type": actual_type,
-                        "message": f"State key '{key}' has type '{actual_type}' but expected '{expected_type}'",
-                        "severity": "warning"
-                    })
+            check = checks.get(key)
+            if check is not None and not check[1](value):
+                expected_type = check[0]
+                actual_type = type(value).__name__
+                warnings.append({
+                    "variable_name": key,
+                    "expected_type": expected_type,
+                    "actual_type": actual_type,
+                    "message": f"State key '{key}' has type '{actual_type}' but expected '{expected_type}'",
+                    "severity": "warning"
+                })
 
         # Check for missing required inputs
-        for var in inputs:
-            if var.get("required") and var["name"] not in state:
+        for name, expected_type in plan.required:
+            if name not in state:
                 warnings.append({
-                    "variable_name": var["name"],
-                    "expected_type": var.get("type", "string"),
+                    "variable_name": name,
+                    "expected_type": expected_type,
                     "actual_type": "missing",
-                    "message": f"Required input '{var['name']}' is missing from state",
+                    "message": f"Required input '{name}' is missing from state",
                     "severity": "warning"
                 })
 
@@ -357,6 +527,53 @@ class StateManager:
         """
         Broadcast state change event to both NATS and MQTT.
         Called after database update.
+        With a coalesce window set, rapid changes to one entity are merged
+        into a single event carrying the net change.
+        """
+        if self.state_coalesce_window <= 0:
+            await self._publish_state_change(
+                entity_id, entity_slug, entity_type, entity_path,
+                previous_state, new_state, source, entity_metadata
+            )
+            return
+
+        pending = self._pending_state_changes.get(entity_id)
+        if pending is not None:
+            # Keep the original previous_state so the flush carries the net change
+            pending[2] = entity_path
+            pending[4] = new_state
+            pending[5] = source
+            pending[6] = entity_metadata
+            return
+
+        self._pending_state_changes[entity_id] = [
+            entity_slug, entity_type, entity_path,
+            previous_state, new_state, source, entity_metadata
+        ]
+        task = asyncio.create_task(self._flush_state_change(entity_id))
+        self._coalesce_tasks.add(task)
+        task.add_done_callback(self._coalesce_tasks.discard)
+
+    async def _flush_state_change(self, entity_id: UUID):
+        """Publish the coalesced state change for an entity once its window closes"""
+        await asyncio.sleep(self.state_coalesce_window)
+        pending = self._pending_state_changes.pop(entity_id, None)
+        if pending is not None:
+            await self._publish_state_change(entity_id, *pending)
+
+    async def _publish_state_change(
+        self,
+        entity_id: UUID,
+        entity_slug: str,
+        entity_type: str,
+        entity_path: Optional[str],
+        previous_state: Dict[str, Any],
+        new_state: Dict[str, Any],
+        source: Optional[str] = None,
+        entity_metadata: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Build a state change event and publish it.
         Includes validation warnings if entity has variable definitions.
         """
         changed_keys = self.compute_changed_keys(previous_state, new_state)
@@ -378,24 +595,32 @@ class StateManager:
 
         event = {
             "type": "state_changed",
-            "entity_id": str(entity_id),
+            "entity_id": entity_id,
             "entity_slug": entity_slug,
             "entity_type": entity_type,
             "path": entity_path,
-            "previous_state": previous_state,
-            "current_state": new_state,
             "changed_keys": changed_keys,
             "source": source,
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": datetime.now(timezone.utc),
             "validation_warnings": validation_warnings
         }
+        if self.state_event_format == "delta":
+            # Versioned so subscribers can tell a delta event from a full one
+            event["v"] = 2
+            event["delta"] = {
+                key: {"prev": previous_state.get(key), "new": new_state.get(key)}
+                for key in changed_keys
+            }
+        else:
+            event["previous_state"] = previous_state
+            event["current_state"] = new_state
 
-        # Broadcast to both NATS and MQTT concurrently
-        await asyncio.gather(
-            self._publish_nats(entity_slug, entity_type, event),
-            self._publish_mqtt(entity_slug, entity_type, event),
-            return_exceptions=True
-        )
+        payload = _encode_event(event)
+
+        # Broadcast to both NATS and MQTT. The MQTT publish never suspends,
+        # so it runs inline rather than paying for a gather round-trip.
+        self._publish_mqtt(entity_slug, entity_type, payload)
+        await self._publish_nats(entity_slug, entity_type, payload)
 
     async def broadcast_entity_lifecycle(
         self,
@@ -408,109 +633,92 @@ class StateManager:
         """Broadcast entity lifecycle events (create/update/delete)"""
         event = {
             "type": f"entity_{event_type}",
-            "entity_id": str(entity_id),
+            "entity_id": entity_id,
             "entity_slug": entity_slug,
             "entity_type": entity_type,
             "data": data,
-            "timestamp": datetime.utcnow().isoformat() + "Z"
+            "timestamp": datetime.now(timezone.utc)
         }
 
-        await asyncio.gather(
-            self._publish_nats_lifecycle(event_type, entity_slug, entity_type, event),
-            self._publish_mqtt_lifecycle(event_type, entity_slug, entity_type, event),
-            return_exceptions=True
-        )
+        payload = _encode_event(event)
+
+        self._publish_mqtt_lifecycle(event_type, entity_slug, entity_type, payload)
+        await self._publish_nats_lifecycle(event_type, entity_slug, entity_type, payload)
 
     async def _publish_nats(
         self,
         slug: str,
         entity_type: str,
-        event: Dict[str, Any]
+        payload: bytes
     ):
         """Publish state change to NATS"""
-        if not self.nc or self.nc.is_closed:
+        if not self._nats_up:
             return
 
         try:
-            payload = json.dumps(event).encode()
+            subject, type_subject, _ = _state_routes(entity_type, slug)
+            publish = self.nc.publish
 
             # Publish to specific entity subject
             # Pattern: maestra.entity.state.<type>.<slug>
-            subject = f"maestra.entity.state.{entity_type}.{slug}"
-            await self.nc.publish(subject, payload)
+            await publish(subject, payload)
 
             # Also publish to generic state channel for broad subscriptions
-            await self.nc.publish("maestra.entity.state", payload)
+            await publish("maestra.entity.state", payload)
 
             # Type-level subscription
-            await self.nc.publish(f"maestra.entity.state.{entity_type}", payload)
+            await publish(type_subject, payload)
 
         except Exception as e:
             print(f"⚠️ NATS publish error: {e}")
 
-    async def _publish_mqtt(
+    def _publish_mqtt(
         self,
         slug: str,
         entity_type: str,
-        event: Dict[str, Any]
+        payload: bytes
     ):
         """Publish state change to MQTT"""
-        if not self.mqtt_client:
+        if self._mqtt_out is None:
             return
 
-        try:
-            payload = json.dumps(event)
-
-            # Topic pattern: maestra/entity/state/<type>/<slug>
-            topic = f"maestra/entity/state/{entity_type}/{slug}"
-            self.mqtt_client.publish(topic, payload, qos=1)
-
-            # Generic topic for broad subscriptions
-            self.mqtt_client.publish("maestra/entity/state", payload, qos=1)
-
-            # Type-level topic
-            self.mqtt_client.publish(f"maestra/entity/state/{entity_type}", payload, qos=1)
-
-        except Exception as e:
-            print(f"⚠️ MQTT publish error: {e}")
+        # Topic pattern: maestra/entity/state/<type>/<slug>
+        # Type-level and broad feeds are served by broker wildcards
+        # (maestra/entity/state/<type>/+ and maestra/entity/state/#)
+        self._enqueue_mqtt(_state_routes(entity_type, slug)[2], payload, MQTT_STATE_QOS)
 
     async def _publish_nats_lifecycle(
         self,
         event_type: str,
         slug: str,
         entity_type: str,
-        event: Dict[str, Any]
+        payload: bytes
     ):
         """Publish lifecycle event to NATS"""
-        if not self.nc or self.nc.is_closed:
+        if not self._nats_up:
             return
 
         try:
-            payload = json.dumps(event).encode()
-            subject = f"maestra.entity.{event_type}.{entity_type}.{slug}"
-            await self.nc.publish(subject, payload)
-            await self.nc.publish(f"maestra.entity.{event_type}", payload)
+            subject, event_subject, _ = _lifecycle_routes(event_type, entity_type, slug)
+            publish = self.nc.publish
+            await publish(subject, payload)
+            await publish(event_subject, payload)
         except Exception as e:
             print(f"⚠️ NATS lifecycle publish error: {e}")
 
-    async def _publish_mqtt_lifecycle(
+    def _publish_mqtt_lifecycle(
         self,
         event_type: str,
         slug: str,
         entity_type: str,
-        event: Dict[str, Any]
+        payload: bytes
     ):
         """Publish lifecycle event to MQTT"""
-        if not self.mqtt_client:
+        if self._mqtt_out is None:
             return
 
-        try:
-            payload = json.dumps(event)
-            topic = f"maestra/entity/{event_type}/{entity_type}/{slug}"
-            self.mqtt_client.publish(topic, payload, qos=1)
-            self.mqtt_client.publish(f"maestra/entity/{event_type}", payload, qos=1)
-        except Exception as e:
-            print(f"⚠️ MQTT lifecycle publish error: {e}")
+        # Broad feed via wildcard: maestra/entity/<event_type>/#
+        self._enqueue_mqtt(_lifecycle_routes(event_type, entity_type, slug)[2], payload)
 
     async def subscribe_nats(self, subject: str, callback: Callable):
         """Subscribe to NATS subject"""
@@ -7,7 +7,9 @@ and NATS (events/negotiation). PostgreSQL stores session history.
 import json
 import asyncio
 import logging
-from datetime import datetime
+import time
+from functools import lru_cache
+from datetime import datetime, timezone
 from typing import Dict, Any, List, Optional
 from uuid import UUID, uuid4
 
@@ -15,25 +17,92 @@ from nats.aio.client import Client as NATS
 from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
+from pydantic_core import to_json
 
 logger = logging.getLogger(__name__)
 
 # Redis key patterns
-STREAM_KEY = "stream:{stream_id}"
 STREAM_INDEX_ALL = "streams:all"
-STREAM_INDEX_TYPE = "streams:by_type:{stream_type}"
-SESSION_KEY = "session:{session_id}"
-SESSION_INDEX_STREAM = "sessions:by_stream:{stream_id}"
 SESSION_INDEX_ALL = "sessions:all"
-SUBSCRIBER_KEY = "subscriber:{subscriber_id}"
-SUBSCRIBER_INDEX_STREAM = "subscribers:by_stream:{stream_id}"
 SUBSCRIBER_INDEX_ALL = "subscribers:all"
 
+
+def _stream_key(stream_id: str) -> str:
+    return f"stream:{stream_id}"
+
+
+def _stream_type_index(stream_type: str) -> str:
+    return f"streams:by_type:{stream_type}"
+
+
+def _session_key(session_id: str) -> str:
+    return f"session:{session_id}"
+
+
+def _stream_sessions_index(stream_id: str) -> str:
+    return f"sessions:by_stream:{stream_id}"
+
+
+def _subscriber_key(subscriber_id: str) -> str:
+    return f"subscriber:{subscriber_id}"
+
+
+def _stream_subscribers_index(stream_id: str) -> str:
+    return f"subscribers:by_stream:{stream_id}"
+
+
+@lru_cache(maxsize=64)
+def _advert_subjects(stream_type: str) -> tuple:
+    """NATS subjects for a stream type's advertisement: (typed, MQTT bridge)"""
+    return (
+        f"maestra.stream.advertise.{stream_type}",
+        f"maestra.to_mqtt.maestra.stream.advertise.{stream_type}",
+    )
+
+
 # TTL in seconds for Redis keys
 STREAM_TTL = 30
 SESSION_TTL = 30
 SUBSCRIBER_TTL = 30
 
+# Stamp last_heartbeat and extend the TTL only if the stream still exists,
+# in a single server-side call (returns 1 if refreshed, 0 if missing)
+REFRESH_STREAM_LUA = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    redis.call('HSET', KEYS[1], 'last_heartbeat', ARGV[1])
+    redis.call('EXPIRE', KEYS[1], ARGV[2])
+    return 1
+end
+return 0
+"""
+
+# Heartbeats received within this many seconds are written to Redis together
+HEARTBEAT_FLUSH_INTERVAL = 0.2
+
+# Session history writes (start inserts and end updates) are flushed in batches
+# of up to this many, waiting at most this long for a batch to fill
+SESSION_LOG_BATCH_SIZE = 100
+SESSION_LOG_FLUSH_INTERVAL = 0.05
+SESSION_LOG_QUEUE_SIZE = 10000
+
+INSERT_SESSION_START = text("""
+    INSERT INTO stream_sessions
+    (time, session_id, stream_id, stream_name, stream_type,
+     publisher_id, publisher_address, consumer_id, consumer_address,
+     protocol, transport_config, status)
+    VALUES (:time, :session_id, :stream_id, :stream_name, :stream_type,
+            :publisher_id, :publisher_address, :consumer_id, :consumer_address,
+            :protocol, :transport_config, 'active')
+""")
+
+UPDATE_SESSION_END = text("""
+    UPDATE stream_sessions
+    SET status = 'stopped',
+        ended_at = :ended_at,
+        duration_seconds = :duration
+    WHERE session_id = :session_id
+""")
+
 
 class StreamManager:
     """
@@ -46,11 +115,34 @@ class StreamManager:
         self.redis: Optional[Redis] = None
         self._connected = False
         self._subscriptions = []
+        self._refresh_stream_script = None
+        # Encoded MQTT advertisement (subject, payload) per stream, reused by
+        # the heartbeat rebroadcast instead of re-reading and re-encoding it
+        self._mqtt_adverts: Dict[str, tuple] = {}
+        # Ids advertised or refreshed since the last advert sweep; cached adverts
+        # outside it belong to streams whose Redis keys have expired
+        self._adverts_live: set = set()
+        # Ids with a heartbeat pending since the last flush
+        self._hb_streams: set = set()
+        self._hb_sessions: set = set()
+        self._hb_subscribers: set = set()
+        self._hb_task: Optional[asyncio.Task] = None
+        # Session start and end writes waiting to be flushed to Postgres, in order
+        self._session_log_q: Optional[asyncio.Queue] = None
+        self._session_log_task: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def _now() -> str:
+        """Current UTC time as an ISO string with a Z suffix"""
+        return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
     async def connect(self, nats_client: NATS, redis_client: Redis):
         """Initialize with shared NATS and Redis connections"""
         self.nc = nats_client
         self.redis = redis_client
+        self._refresh_stream_script = redis_client.register_script(REFRESH_STREAM_LUA)
+        self._session_log_q = asyncio.Queue(maxsize=SESSION_LOG_QUEUE_SIZE)
+        self._session_log_task = asyncio.create_task(self._session_log_writer())
 
         if self.nc and not self.nc.is_closed:
             # Subscribe to heartbeat subjects for TTL refresh
@@ -64,6 +156,7 @@ class StreamManager:
                 "maestra.stream.subscriber.heartbeat.>", cb=self._on_subscriber_heartbeat
             )
             self._subscriptions = [sub1, sub2, sub3]
+            self._hb_task = asyncio.create_task(self._heartbeat_flush_loop())
             print("✅ Stream Manager: NATS subscriptions active")
 
         self._connected = True
@@ -77,6 +170,15 @@ class StreamManager:
             except Exception:
                 pass
         self._subscriptions = []
+        for task in (self._hb_task, self._session_log_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._hb_task = None
+        self._session_log_task = None
         self._connected = False
         print("📴 Stream Manager disconnected")
 
@@ -90,7 +192,7 @@ class StreamManager:
         Returns the full stream info including generated ID.
         """
         stream_id = str(uuid4())
-        now = datetime.utcnow().isoformat() + "Z"
+        now = self._now()
 
         multicast_group = advert.get("multicast_group") or ""
         multicast_port = str(advert["multicast_port"]) if advert.get("multicast_port") is not None else ""
@@ -115,17 +217,17 @@ class StreamManager:
             "last_heartbeat": now,
         }
 
-        # Store in Redis with TTL
-        key = STREAM_KEY.format(stream_id=stream_id)
-        await self.redis.hset(key, mapping=stream_data)
-        await self.redis.expire(key, STREAM_TTL)
-
-        # Add to index sets
-        await self.redis.sadd(STREAM_INDEX_ALL, stream_id)
-        await self.redis.sadd(
-            STREAM_INDEX_TYPE.format(stream_type=advert["stream_type"]),
-            stream_id,
-        )
+        # Store in Redis with TTL and add to index sets in one round-trip
+        key = _stream_key(stream_id)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.hset(key, mapping=stream_data)
+            pipe.expire(key, STREAM_TTL)
+            pipe.sadd(STREAM_INDEX_ALL, stream_id)
+            pipe.sadd(
+                _stream_type_index(advert["stream_type"]),
+                stream_id,
+            )
+            await pipe.execute()
 
         # Publish NATS event
         if self.nc and not self.nc.is_closed:
@@ -137,11 +239,10 @@ class StreamManager:
                 "name": advert["name"],
                 "timestamp": now,
             }
-            payload = json.dumps(event).encode()
+            payload = to_json(event)
+            typed_subject, mqtt_subject = _advert_subjects(advert["stream_type"])
             await self.nc.publish("maestra.stream.advertise", payload)
-            await self.nc.publish(
-                f"maestra.stream.advertise.{advert['stream_type']}", payload
-            )
+            await self.nc.publish(typed_subject, payload)
 
             # Also publish to MQTT via the NATS→MQTT bridge so embedded/IoT
             # clients (e.g. ESP32 dashboard) can discover streams.  The bridge
@@ -160,57 +261,62 @@ class StreamManager:
             if multicast_group:
                 mqtt_event["multicast_group"] = multicast_group
                 mqtt_event["multicast_port"] = advert["multicast_port"]
-            await self.nc.publish(
-                f"maestra.to_mqtt.maestra.stream.advertise.{advert['stream_type']}",
-                json.dumps(mqtt_event).encode(),
-            )
+            mqtt_advert = (mqtt_subject, to_json(mqtt_event))
+            self._mqtt_adverts[stream_id] = mqtt_advert
+            self._adverts_live.add(stream_id)
+            await self.nc.publish(*mqtt_advert)
 
         return self._parse_stream_data(stream_data)
 
     async def withdraw_stream(self, stream_id: str):
         """Remove a stream from Redis and publish NATS event"""
-        key = STREAM_KEY.format(stream_id=stream_id)
+        key = _stream_key(stream_id)
         stream_data = await self.redis.hgetall(key)
 
         if not stream_data:
             return False
 
         stream_type = stream_data.get("stream_type", "")
-
-        # Remove from Redis
-        await self.redis.delete(key)
-        await self.redis.srem(STREAM_INDEX_ALL, stream_id)
-        if stream_type:
-            await self.redis.srem(
-                STREAM_INDEX_TYPE.format(stream_type=stream_type), stream_id
-            )
-
-        # Clean up any session references
-        session_index_key = SESSION_INDEX_STREAM.format(stream_id=stream_id)
-        session_ids = await self.redis.smembers(session_index_key)
-        for sid in session_ids:
-            await self.redis.delete(SESSION_KEY.format(session_id=sid))
-            await self.redis.srem(SESSION_INDEX_ALL, sid)
-        await self.redis.delete(session_index_key)
-
-        # Clean up any subscriber references (multicast streams)
-        sub_index_key = SUBSCRIBER_INDEX_STREAM.format(stream_id=stream_id)
-        sub_ids = await self.redis.smembers(sub_index_key)
-        for sid in sub_ids:
-            await self.redis.delete(SUBSCRIBER_KEY.format(subscriber_id=sid))
-            await self.redis.srem(SUBSCRIBER_INDEX_ALL, sid)
-        await self.redis.delete(sub_index_key)
+        self._mqtt_adverts.pop(stream_id, None)
+
+        # Remove from Redis, reading back the stream's session and
+        # subscriber references in the same round-trip
+        session_index_key = _stream_sessions_index(stream_id)
+        sub_index_key = _stream_subscribers_index(stream_id)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.delete(key)
+            pipe.srem(STREAM_INDEX_ALL, stream_id)
+            if stream_type:
+                pipe.srem(
+                    _stream_type_index(stream_type), stream_id
+                )
+            pipe.smembers(session_index_key)
+            pipe.smembers(sub_index_key)
+            results = await pipe.execute()
+        session_ids, sub_ids = results[-2:]
+
+        # Clean up session and subscriber references (subscribers exist for
+        # multicast streams) with one varargs DEL/SREM per index
+        async with self.redis.pipeline(transaction=False) as pipe:
+            if session_ids:
+                pipe.delete(*[_session_key(sid) for sid in session_ids])
+                pipe.srem(SESSION_INDEX_ALL, *session_ids)
+            if sub_ids:
+                pipe.delete(*[_subscriber_key(sid) for sid in sub_ids])
+                pipe.srem(SUBSCRIBER_INDEX_ALL, *sub_ids)
+            pipe.delete(session_index_key, sub_index_key)
+            await pipe.execute()
 
         # Publish NATS event
         if self.nc and not self.nc.is_closed:
             event = {
                 "type": "stream_withdrawn",
                 "stream_id": stream_id,
-                "timestamp": datetime.utcnow().isoformat() + "Z",
+                "timestamp": self._now(),
             }
             await self.nc.publish(
                 f"maestra.stream.withdraw.{stream_id}",
-                json.dumps(event).encode(),
+                to_json(event),
             )
 
         return True
@@ -222,52 +328,57 @@ class StreamManager:
     async def list_streams(self, stream_type: str = None) -> List[Dict[str, Any]]:
         """List active streams from Redis, optionally filtered by type"""
         if stream_type:
-            index_key = STREAM_INDEX_TYPE.format(stream_type=stream_type)
+            index_key = _stream_type_index(stream_type)
         else:
             index_key = STREAM_INDEX_ALL
 
-        stream_ids = await self.redis.smembers(index_key)
-        streams = []
+        stream_ids = list(await self.redis.smembers(index_key))
+        if not stream_ids:
+            return []
 
-        for sid in stream_ids:
-            key = STREAM_KEY.format(stream_id=sid)
-            data = await self.redis.hgetall(key)
+        # Fetch every hash plus its session/subscriber counts in one round-trip
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for sid in stream_ids:
+                pipe.hgetall(_stream_key(sid))
+                pipe.scard(_stream_sessions_index(sid))
+                pipe.scard(_stream_subscribers_index(sid))
+            results = await pipe.execute()
+
+        streams = []
+        stale = []
+        for i, sid in enumerate(stream_ids):
+            data, session_count, sub_count = results[3 * i:3 * i + 3]
             if data:
                 stream_info = self._parse_stream_data(data)
-                # Count active sessions
-                session_count = await self.redis.scard(
-                    SESSION_INDEX_STREAM.format(stream_id=sid)
-                )
                 stream_info["active_sessions"] = session_count
-                # Count active subscribers (multicast)
-                sub_count = await self.redis.scard(
-                    SUBSCRIBER_INDEX_STREAM.format(stream_id=sid)
-                )
                 stream_info["active_subscribers"] = sub_count
                 streams.append(stream_info)
             else:
-                # Stream expired, clean up stale index entry
-                await self.redis.srem(STREAM_INDEX_ALL, sid)
+                stale.append(sid)
+                self._mqtt_adverts.pop(sid, None)
+
+        if stale:
+            # Streams expired, clean up stale index entries
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.srem(STREAM_INDEX_ALL, *stale)
                 if stream_type:
-                    await self.redis.srem(index_key, sid)
+                    pipe.srem(index_key, *stale)
+                await pipe.execute()
 
         return streams
 
     async def get_stream(self, stream_id: str) -> Optional[Dict[str, Any]]:
         """Get a single stream from Redis"""
-        key = STREAM_KEY.format(stream_id=stream_id)
-        data = await self.redis.hgetall(key)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.hgetall(_stream_key(stream_id))
+            pipe.scard(_stream_sessions_index(stream_id))
+            pipe.scard(_stream_subscribers_index(stream_id))
+            data, session_count, sub_count = await pipe.execute()
         if not data:
             return None
 
         stream_info = self._parse_stream_data(data)
-        session_count = await self.redis.scard(
-            SESSION_INDEX_STREAM.format(stream_id=stream_id)
-        )
         stream_info["active_sessions"] = session_count
-        sub_count = await self.redis.scard(
-            SUBSCRIBER_INDEX_STREAM.format(stream_id=stream_id)
-        )
         stream_info["active_subscribers"] = sub_count
         return stream_info
 
@@ -282,7 +393,6 @@ class StreamManager:
         consumer_address: str,
         consumer_port: Optional[int] = None,
         config: Optional[Dict[str, Any]] = None,
-        db_session: Optional[AsyncSession] = None,
     ) -> Dict[str, Any]:
         """
         Request to consume a stream via NATS request-reply.
@@ -303,7 +413,7 @@ class StreamManager:
             "consumer_address": consumer_address,
             "consumer_port": consumer_port,
             "config": config or {},
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": self._now(),
         }
 
         # NATS request-reply to publisher (5s timeout)
@@ -311,10 +421,10 @@ class StreamManager:
         try:
             response = await self.nc.request(
                 subject,
-                json.dumps(request_payload).encode(),
+                to_json(request_payload),
                 timeout=5.0,
             )
-            offer_data = json.loads(response.data.decode())
+            offer_data = json.loads(response.data)
         except asyncio.TimeoutError:
             raise TimeoutError("Publisher did not respond within 5 seconds")
         except Exception as e:
@@ -327,7 +437,7 @@ class StreamManager:
 
         # Create session
         session_id = str(uuid4())
-        now = datetime.utcnow().isoformat() + "Z"
+        now = self._now()
 
         session_data = {
             "session_id": session_id,
@@ -352,19 +462,18 @@ class StreamManager:
         }
 
         # Store session in Redis
-        sess_key = SESSION_KEY.format(session_id=session_id)
-        await self.redis.hset(sess_key, mapping=session_data)
-        await self.redis.expire(sess_key, SESSION_TTL)
-        await self.redis.sadd(
-            SESSION_INDEX_STREAM.format(stream_id=stream_id), session_id
-        )
-        await self.redis.sadd(SESSION_INDEX_ALL, session_id)
-
-        # Log to Postgres (fire-and-forget)
-        if db_session:
-            asyncio.create_task(
-                self._log_session_start(db_session, session_data)
+        sess_key = _session_key(session_id)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.hset(sess_key, mapping=session_data)
+            pipe.expire(sess_key, SESSION_TTL)
+            pipe.sadd(
+                _stream_sessions_index(stream_id), session_id
             )
+            pipe.sadd(SESSION_INDEX_ALL, session_id)
+            await pipe.execute()
+
+        # Log to Postgres (batched in the background)
+        self._log_session_start(session_data)
 
         # Publish lifecycle event
         lifecycle_event = {
@@ -374,7 +483,7 @@ class StreamManager:
         }
         await self.nc.publish(
             "maestra.stream.session.started",
-            json.dumps(lifecycle_event).encode(),
+            to_json(lifecycle_event),
         )
 
         return {
@@ -401,33 +510,40 @@ class StreamManager:
     ) -> List[Dict[str, Any]]:
         """List active sessions from Redis"""
         if stream_id:
-            index_key = SESSION_INDEX_STREAM.format(stream_id=stream_id)
+            index_key = _stream_sessions_index(stream_id)
         else:
             index_key = SESSION_INDEX_ALL
 
-        session_ids = await self.redis.smembers(index_key)
-        sessions = []
+        session_ids = list(await self.redis.smembers(index_key))
+        if not session_ids:
+            return []
 
-        for sid in session_ids:
-            key = SESSION_KEY.format(session_id=sid)
-            data = await self.redis.hgetall(key)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for sid in session_ids:
+                pipe.hgetall(_session_key(sid))
+            results = await pipe.execute()
+
+        sessions = []
+        stale = []
+        for sid, data in zip(session_ids, results):
             if data:
                 sessions.append(self._parse_session_data(data))
             else:
-                # Session expired, clean up stale index entry
-                await self.redis.srem(SESSION_INDEX_ALL, sid)
+                stale.append(sid)
+
+        if stale:
+            # Sessions expired, clean up stale index entries
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.srem(SESSION_INDEX_ALL, *stale)
                 if stream_id:
-                    await self.redis.srem(index_key, sid)
+                    pipe.srem(index_key, *stale)
+                await pipe.execute()
 
         return sessions
 
-    async def stop_session(
-        self,
-        session_id: str,
-        db_session: Optional[AsyncSession] = None,
-    ):
+    async def stop_session(self, session_id: str):
         """Stop a session and clean up"""
-        key = SESSION_KEY.format(session_id=session_id)
+        key = _session_key(session_id)
         session_data = await self.redis.hgetall(key)
 
         if not session_data:
@@ -436,18 +552,17 @@ class StreamManager:
         stream_id = session_data.get("stream_id", "")
 
         # Remove from Redis
-        await self.redis.delete(key)
-        await self.redis.srem(SESSION_INDEX_ALL, session_id)
-        if stream_id:
-            await self.redis.srem(
-                SESSION_INDEX_STREAM.format(stream_id=stream_id), session_id
-            )
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.delete(key)
+            pipe.srem(SESSION_INDEX_ALL, session_id)
+            if stream_id:
+                pipe.srem(
+                    _stream_sessions_index(stream_id), session_id
+                )
+            await pipe.execute()
 
         # Update Postgres record
-        if db_session:
-            asyncio.create_task(
-                self._log_session_end(db_session, session_id, session_data)
-            )
+        self._log_session_end(session_id, session_data)
 
         # Publish lifecycle event
         if self.nc and not self.nc.is_closed:
@@ -455,11 +570,11 @@ class StreamManager:
                 "type": "session_stopped",
                 "session_id": session_id,
                 "stream_id": stream_id,
-                "timestamp": datetime.utcnow().isoformat() + "Z",
+                "timestamp": self._now(),
             }
             await self.nc.publish(
                 "maestra.stream.session.stopped",
-                json.dumps(event).encode(),
+                to_json(event),
             )
 
         return True
@@ -472,156 +587,206 @@ class StreamManager:
         """Refresh a stream's TTL in Redis and re-broadcast to MQTT so
         late-joining IoT/embedded clients (e.g. ESP32 dashboard) can
         discover active streams."""
-        key = STREAM_KEY.format(stream_id=stream_id)
-        exists = await self.redis.exists(key)
-        if exists:
-            await self.redis.hset(
-                key, "last_heartbeat", datetime.utcnow().isoformat() + "Z"
-            )
-            await self.redis.expire(key, STREAM_TTL)
+        key = _stream_key(stream_id)
+        refreshed = await self._refresh_stream_script(
+            keys=[key],
+            args=[self._now(), STREAM_TTL],
+        )
+        if refreshed:
             # Re-broadcast stream info to MQTT for late-joining clients
             await self._rebroadcast_stream_to_mqtt(stream_id)
             return True
+        self._mqtt_adverts.pop(stream_id, None)
         return False
 
     async def refresh_session_ttl(self, session_id: str) -> bool:
         """Refresh a session's TTL in Redis"""
-        key = SESSION_KEY.format(session_id=session_id)
-        exists = await self.redis.exists(key)
-        if exists:
-            await self.redis.expire(key, SESSION_TTL)
-            return True
-        return False
+        # EXPIRE returns 0 when the key is gone, so no separate EXISTS check
+        return bool(await self.redis.expire(_session_key(session_id), SESSION_TTL))
 
     async def _on_stream_heartbeat(self, msg):
-        """Handle stream heartbeat via NATS"""
-        try:
-            subject_parts = msg.subject.split(".")
-            if len(subject_parts) >= 4:
-                stream_id = subject_parts[3]
-                await self.refresh_stream_ttl(stream_id)
-        except Exception as e:
-            logger.warning(f"Stream heartbeat error: {e}")
+        """Handle stream heartbeat via NATS; the TTL refresh is batched"""
+        # maestra.stream.heartbeat.{stream_id}
+        stream_id = msg.subject.rpartition(".")[2]
+        if stream_id:
+            self._hb_streams.add(stream_id)
+
+    async def _heartbeat_flush_loop(self):
+        """Periodically write pending heartbeats to Redis"""
+        last_sweep = time.monotonic()
+        while True:
+            await asyncio.sleep(HEARTBEAT_FLUSH_INTERVAL)
+            try:
+                await self._flush_heartbeats()
+            except Exception as e:
+                logger.warning(f"Heartbeat flush error: {e}")
+            if time.monotonic() - last_sweep >= STREAM_TTL:
+                self._prune_mqtt_adverts()
+                last_sweep = time.monotonic()
+
+    def _prune_mqtt_adverts(self):
+        """Drop cached adverts for streams that went a full STREAM_TTL without
+        an advertisement or refresh, so streams that simply expire are released"""
+        live = self._adverts_live
+        for sid in [sid for sid in self._mqtt_adverts if sid not in live]:
+            del self._mqtt_adverts[sid]
+        live.clear()
+
+    async def _flush_heartbeats(self):
+        """Refresh TTLs for every id that heartbeated since the last flush,
+        in one pipeline. Repeat heartbeats for an id collapse into one write."""
+        if not (self._hb_streams or self._hb_sessions or self._hb_subscribers):
+            return
+        stream_ids = list(self._hb_streams)
+        session_ids = list(self._hb_sessions)
+        subscriber_ids = list(self._hb_subscribers)
+        self._hb_streams.clear()
+        self._hb_sessions.clear()
+        self._hb_subscribers.clear()
+
+        now = self._now()
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for sid in stream_ids:
+                await self._refresh_stream_script(
+                    keys=[_stream_key(sid)], args=[now, STREAM_TTL], client=pipe
+                )
+            for sid in session_ids:
+                pipe.expire(_session_key(sid), SESSION_TTL)
+            for sid in subscriber_ids:
+                pipe.expire(_subscriber_key(sid), SUBSCRIBER_TTL)
+            results = await pipe.execute()
+
+        for sid, refreshed in zip(stream_ids, results):
+            if refreshed:
+                # Re-broadcast stream info to MQTT for late-joining clients
+                await self._rebroadcast_stream_to_mqtt(sid)
+            else:
+                self._mqtt_adverts.pop(sid, None)
 
     async def _rebroadcast_stream_to_mqtt(self, stream_id: str):
         """Re-publish stream advertisement to MQTT via the NATS→MQTT bridge
         so embedded/IoT clients that connected after the initial advertisement
         can still discover active streams."""
+        self._adverts_live.add(stream_id)
         if not self.nc or self.nc.is_closed:
             return
-        key = STREAM_KEY.format(stream_id=stream_id)
-        data = await self.redis.hgetall(key)
-        if not data:
-            return
-        stream_type = data.get("stream_type", "sensor")
-        try:
-            port_val = int(data.get("port", 0))
-        except (ValueError, TypeError):
-            port_val = 0
-        mqtt_event = {
-            "id": data.get("id", stream_id),
-            "name": data.get("name", ""),
-            "stream_type": stream_type,
-            "address": data.get("address", ""),
-            "port": port_val,
-            "config": json.loads(data.get("config", "{}")),
-        }
-        await self.nc.publish(
-            f"maestra.to_mqtt.maestra.stream.advertise.{stream_type}",
-            json.dumps(mqtt_event).encode(),
-        )
+        # Stream records don't change after advertisement, so the encoded
+        # advert stays valid until the stream is withdrawn or expires
+        mqtt_advert = self._mqtt_adverts.get(stream_id)
+        if mqtt_advert is None:
+            # Advertised before this process started; rebuild from Redis
+            key = _stream_key(stream_id)
+            data = await self.redis.hgetall(key)
+            if not data:
+                return
+            stream_type = data.get("stream_type", "sensor")
+            try:
+                port_val = int(data.get("port", 0))
+            except (ValueError, TypeError):
+                port_val = 0
+            mqtt_event = {
+                "id": data.get("id", stream_id),
+                "name": data.get("name", ""),
+                "stream_type": stream_type,
+                "address": data.get("address", ""),
+                "port": port_val,
+                "config": json.loads(data.get("config", "{}")),
+                "delivery_mode": data.get("delivery_mode", "unicast"),
+            }
+            if data.get("multicast_group"):
+                mqtt_event["multicast_group"] = data["multicast_group"]
+                mqtt_event["multicast_port"] = int(data.get("multicast_port") or 0)
+            mqtt_advert = (_advert_subjects(stream_type)[1], to_json(mqtt_event))
+            self._mqtt_adverts[stream_id] = mqtt_advert
+        await self.nc.publish(*mqtt_advert)
 
     async def _on_session_heartbeat(self, msg):
-        """Handle session heartbeat via NATS"""
-        try:
-            subject_parts = msg.subject.split(".")
-            if len(subject_parts) >= 5:
-                session_id = subject_parts[4]
-                await self.refresh_session_ttl(session_id)
-        except Exception as e:
-            logger.warning(f"Session heartbeat error: {e}")
+        """Handle session heartbeat via NATS; the TTL refresh is batched"""
+        # maestra.stream.session.heartbeat.{session_id}
+        session_id = msg.subject.rpartition(".")[2]
+        if session_id:
+            self._hb_sessions.add(session_id)
 
     # =========================================================================
     # Postgres Logging
     # =========================================================================
 
-    async def _log_session_start(
-        self, db_session: AsyncSession, session_data: Dict[str, Any]
-    ):
-        """Log session start to Postgres hypertable"""
+    def _log_session_start(self, session_data: Dict[str, Any]):
+        """Queue a session start row for the Postgres hypertable"""
+        row = {
+            "time": datetime.utcnow(),
+            "session_id": session_data["session_id"],
+            "stream_id": session_data["stream_id"],
+            "stream_name": session_data["stream_name"],
+            "stream_type": session_data["stream_type"],
+            "publisher_id": session_data["publisher_id"],
+            "publisher_address": session_data.get("publisher_address", ""),
+            "consumer_id": session_data["consumer_id"],
+            "consumer_address": session_data.get("consumer_address", ""),
+            "protocol": session_data.get("protocol", ""),
+            "transport_config": session_data.get("transport_config", "{}"),
+        }
         try:
-            async with db_session.begin():
-                await db_session.execute(
-                    text("""
-                        INSERT INTO stream_sessions
-                        (time, session_id, stream_id, stream_name, stream_type,
-                         publisher_id, publisher_address, consumer_id, consumer_address,
-                         protocol, transport_config, status)
-                        VALUES (:time, :session_id, :stream_id, :stream_name, :stream_type,
-                                :publisher_id, :publisher_address, :consumer_id, :consumer_address,
-                                :protocol, :transport_config, 'active')
-                    """),
-                    {
-                        "time": datetime.utcnow(),
-                        "session_id": session_data["session_id"],
-                        "stream_id": session_data["stream_id"],
-                        "stream_name": session_data["stream_name"],
-                        "stream_type": session_data["stream_type"],
-                        "publisher_id": session_data["publisher_id"],
-                        "publisher_address": session_data.get(
-                            "publisher_address", ""
-                        ),
-                        "consumer_id": session_data["consumer_id"],
-                        "consumer_address": session_data.get(
-                            "consumer_address", ""
-                        ),
-                        "protocol": session_data.get("protocol", ""),
-                        "transport_config": session_data.get(
-                            "transport_config", "{}"
-                        ),
-                    },
-                )
-        except Exception as e:
-            logger.error(f"Failed to log session start: {e}")
+            self._session_log_q.put_nowait((INSERT_SESSION_START, row))
+        except asyncio.QueueFull:
+            logger.error("Failed to log session start: log queue full")
 
-    async def _log_session_end(
-        self,
-        db_session: AsyncSession,
-        session_id: str,
-        session_data: Dict[str, Any],
-    ):
-        """Update session record in Postgres with end time and duration"""
+    def _log_session_end(self, session_id: str, session_data: Dict[str, Any]):
+        """Queue the end time and duration update for a session record.
+
+        Goes through the same queue as the start insert so it can never be
+        committed ahead of the row it updates.
+        """
+        ended_at = datetime.utcnow()
+        duration = None
+        started_at = session_data.get("started_at", "")
+        if started_at:
+            try:
+                start = datetime.fromisoformat(started_at.replace("Z", "+00:00"))
+                duration = (ended_at - start.replace(tzinfo=None)).total_seconds()
+            except Exception:
+                pass
         try:
-            started_at = session_data.get("started_at", "")
-            duration = None
-            if started_at:
+            self._session_log_q.put_nowait((UPDATE_SESSION_END, {
+                "session_id": session_id,
+                "ended_at": ended_at,
+                "duration": duration,
+            }))
+        except asyncio.QueueFull:
+            logger.error("Failed to log session end: log queue full")
+
+    async def _session_log_writer(self):
+        """Write queued session history in batches, one transaction each"""
+        from database import async_session_maker
+
+        loop = asyncio.get_running_loop()
+        queue = self._session_log_q
+        while True:
+            items = [await queue.get()]
+            deadline = loop.time() + SESSION_LOG_FLUSH_INTERVAL
+            while len(items) < SESSION_LOG_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
                 try:
-                    start = datetime.fromisoformat(
-                        started_at.replace("Z", "+00:00")
-                    )
-                    duration = (
-                        datetime.utcnow() - start.replace(tzinfo=None)
-                    ).total_seconds()
-                except Exception:
-                    pass
+                    items.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
 
-            async with db_session.begin():
-                await db_session.execute(
-                    text("""
-                        UPDATE stream_sessions
-                        SET status = 'stopped',
-                            ended_at = :ended_at,
-                            duration_seconds = :duration
-                        WHERE session_id = :session_id
-                    """),
-                    {
-                        "session_id": session_id,
-                        "ended_at": datetime.utcnow(),
-                        "duration": duration,
-                    },
-                )
-        except Exception as e:
-            logger.error(f"Failed to log session end: {e}")
+            try:
+                async with async_session_maker() as db:
+                    async with db.begin():
+                        # Consecutive writes of one kind go out as a single
+                        # executemany; queue order is kept across kinds
+                        run_stmt, run_params = items[0][0], []
+                        for stmt, params in items:
+                            if stmt is not run_stmt:
+                                await db.execute(run_stmt, run_params)
+                                run_stmt, run_params = stmt, []
+                            run_params.append(params)
+                        await db.execute(run_stmt, run_params)
+            except Exception as e:
+                logger.error(f"Failed to log {len(items)} session history write(s): {e}")
 
     # =========================================================================
     # Helpers
@@ -699,7 +864,7 @@ class StreamManager:
             )
 
         subscriber_id = str(uuid4())
-        now = datetime.utcnow().isoformat() + "Z"
+        now = self._now()
 
         sub_data = {
             "subscriber_id": subscriber_id,
@@ -716,14 +881,16 @@ class StreamManager:
         }
 
         # Store in Redis with TTL
-        key = SUBSCRIBER_KEY.format(subscriber_id=subscriber_id)
-        await self.redis.hset(key, mapping=sub_data)
-        await self.redis.expire(key, SUBSCRIBER_TTL)
-        await self.redis.sadd(
-            SUBSCRIBER_INDEX_STREAM.format(stream_id=stream_id),
-            subscriber_id,
-        )
-        await self.redis.sadd(SUBSCRIBER_INDEX_ALL, subscriber_id)
+        key = _subscriber_key(subscriber_id)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.hset(key, mapping=sub_data)
+            pipe.expire(key, SUBSCRIBER_TTL)
+            pipe.sadd(
+                _stream_subscribers_index(stream_id),
+                subscriber_id,
+            )
+            pipe.sadd(SUBSCRIBER_INDEX_ALL, subscriber_id)
+            await pipe.execute()
 
         # Log to Postgres (fire-and-forget)
         if db_session:
@@ -745,7 +912,7 @@ class StreamManager:
             }
             await self.nc.publish(
                 "maestra.stream.subscriber.joined",
-                json.dumps(event).encode(),
+                to_json(event),
             )
 
         return {
@@ -766,19 +933,21 @@ class StreamManager:
         db_session: Optional[AsyncSession] = None,
     ) -> bool:
         """Remove a subscriber from a multicast stream"""
-        key = SUBSCRIBER_KEY.format(subscriber_id=subscriber_id)
+        key = _subscriber_key(subscriber_id)
         sub_data = await self.redis.hgetall(key)
 
         if not sub_data:
             return False
 
         # Remove from Redis
-        await self.redis.delete(key)
-        await self.redis.srem(SUBSCRIBER_INDEX_ALL, subscriber_id)
-        await self.redis.srem(
-            SUBSCRIBER_INDEX_STREAM.format(stream_id=stream_id),
-            subscriber_id,
-        )
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.delete(key)
+            pipe.srem(SUBSCRIBER_INDEX_ALL, subscriber_id)
+            pipe.srem(
+                _stream_subscribers_index(stream_id),
+                subscriber_id,
+            )
+            await pipe.execute()
 
         # Update Postgres record
         if db_session:
@@ -792,11 +961,11 @@ class StreamManager:
                 "type": "subscriber_left",
                 "subscriber_id": subscriber_id,
                 "stream_id": stream_id,
-                "timestamp": datetime.utcnow().isoformat() + "Z",
+                "timestamp": self._now(),
             }
             await self.nc.publish(
                 "maestra.stream.subscriber.left",
-                json.dumps(event).encode(),
+                to_json(event),
             )
 
         return True
@@ -806,45 +975,49 @@ class StreamManager:
     ) -> List[Dict[str, Any]]:
         """List active subscribers from Redis"""
         if stream_id:
-            index_key = SUBSCRIBER_INDEX_STREAM.format(stream_id=stream_id)
+            index_key = _stream_subscribers_index(stream_id)
         else:
             index_key = SUBSCRIBER_INDEX_ALL
 
-        sub_ids = await self.redis.smembers(index_key)
-        subscribers = []
+        sub_ids = list(await self.redis.smembers(index_key))
+        if not sub_ids:
+            return []
 
-        for sid in sub_ids:
-            key = SUBSCRIBER_KEY.format(subscriber_id=sid)
-            data = await self.redis.hgetall(key)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for sid in sub_ids:
+                pipe.hgetall(_subscriber_key(sid))
+            results = await pipe.execute()
+
+        subscribers = []
+        stale = []
+        for sid, data in zip(sub_ids, results):
             if data:
                 subscribers.append(self._parse_subscriber_data(data))
             else:
-                # Subscriber expired, clean up stale index entry
-                await self.redis.srem(SUBSCRIBER_INDEX_ALL, sid)
+                stale.append(sid)
+
+        if stale:
+            # Subscribers expired, clean up stale index entries
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.srem(SUBSCRIBER_INDEX_ALL, *stale)
                 if stream_id:
-                    await self.redis.srem(index_key, sid)
+                    pipe.srem(index_key, *stale)
+                await pipe.execute()
 
         return subscribers
 
     async def refresh_subscriber_ttl(self, subscriber_id: str) -> bool:
         """Refresh a subscriber's TTL in Redis"""
-        key = SUBSCRIBER_KEY.format(subscriber_id=subscriber_id)
-        exists = await self.redis.exists(key)
-        if exists:
-            await self.redis.expire(key, SUBSCRIBER_TTL)
-            return True
-        return False
+        return bool(
+            await self.redis.expire(_subscriber_key(subscriber_id), SUBSCRIBER_TTL)
+        )
 
     async def _on_subscriber_heartbeat(self, msg):
-        """Handle subscriber heartbeat via NATS"""
-        try:
-            subject_parts = msg.subject.split(".")
-            # maestra.stream.subscriber.heartbeat.{subscriber_id}
-            if len(subject_parts) >= 5:
-                subscriber_id = subject_parts[4]
-                await self.refresh_subscriber_ttl(subscriber_id)
-        except Exception as e:
-            logger.warning(f"Subscriber heartbeat error: {e}")
+        """Handle subscriber heartbeat via NATS; the TTL refresh is batched"""
+        # maestra.stream.subscriber.heartbeat.{subscriber_id}
+        subscriber_id = msg.subject.rpartition(".")[2]
+        if subscriber_id:
+            self._hb_subscribers.add(subscriber_id)
 
     async def _log_subscriber_join(
         self, db_session: AsyncSession, sub_data: Dict[str, Any]
@@ -14,15 +14,20 @@ return connection info only — the user connects with a dedicated tool.
 import asyncio
 import json
 import logging
+import math
 import os
 import socket
 import struct
+import sys
+from array import array
+from operator import mul
 from datetime import datetime
 from typing import AsyncGenerator, Dict, Any, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import StreamingResponse
+from pydantic_core import to_json
 
 from stream_manager import stream_manager
 
@@ -56,6 +61,10 @@ CONNECTION_INFO_TYPES = {"video", "ndi", "srt", "texture", "spout", "syphon"}
 # Protocol Decoders
 # =============================================================================
 
+# SDRF header: magic, seq, center_freq, sample_rate, reserved, fft_size
+_SDRF_HEADER = struct.Struct("<IIdddI")
+
+
 def decode_sdrf(packet: bytes) -> Optional[Dict[str, Any]]:
     """
     Decode an SDRF (Spectrum Data Radio Format) binary packet.
@@ -71,11 +80,11 @@ def decode_sdrf(packet: bytes) -> Optional[Dict[str, Any]]:
     Body:
       [36:]   float32[fft_size]   power in dB
     """
-    if len(packet) < 36:
+    if len(packet) < _SDRF_HEADER.size:
         return None
 
-    magic, seq, center_freq, sample_rate, _reserved, fft_size = struct.unpack(
-        "<IIdddI", packet[:36]
+    magic, seq, center_freq, sample_rate, _reserved, fft_size = (
+        _SDRF_HEADER.unpack_from(packet)
     )
 
     if magic != 0x53445246:
@@ -85,7 +94,11 @@ def decode_sdrf(packet: bytes) -> Optional[Dict[str, Any]]:
     if len(packet) < expected_len:
         return None
 
-    power_db = list(struct.unpack(f"<{fft_size}f", packet[36:36 + fft_size * 4]))
+    # Bulk-copy the float32 bins without a per-packet format string or tuple
+    power_db = array("f")
+    power_db.frombytes(memoryview(packet)[36:expected_len])
+    if sys.byteorder == "big":
+        power_db.byteswap()
 
     return {
         "type": "sensor",
@@ -93,7 +106,7 @@ def decode_sdrf(packet: bytes) -> Optional[Dict[str, Any]]:
         "center_freq": center_freq,
         "sample_rate": sample_rate,
         "fft_size": fft_size,
-        "power_db": power_db,
+        "power_db": power_db.tolist(),
     }
 
 
@@ -121,19 +134,14 @@ def decode_audio_packet(packet: bytes) -> Optional[Dict[str, Any]]:
     if num_samples == 0:
         return None
 
-    samples = struct.unpack(f"<{num_samples}h", packet[:num_samples * 2])
-
-    # Compute RMS level in dB
-    import math
-
-    rms = 0.0
-    peak = 0
-    for s in samples:
-        rms += s * s
-        if abs(s) > peak:
-            peak = abs(s)
+    samples = array("h", packet[:num_samples * 2])
+    if sys.byteorder == "big":
+        samples.byteswap()
 
-    rms = (rms / num_samples) ** 0.5
+    # Compute RMS level in dB; reductions run in C via builtins rather
+    # than a per-sample Python loop
+    peak = max(max(samples), -min(samples))
+    rms = (sum(map(mul, samples, samples)) / num_samples) ** 0.5
     rms_db = 20 * math.log10(max(rms / 32768.0, 1e-12))
     peak_db = 20 * math.log10(max(peak / 32768.0, 1e-12))
 
@@ -172,10 +180,46 @@ def get_decoder(stream_type: str):
 # SSE Event Helpers
 # =============================================================================
 
-def sse_event(event_type: str, data: Dict[str, Any]) -> str:
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",
+}
+
+# Encoded "event: ...\ndata: " prefix per event type
+_SSE_PREFIXES = {
+    event_type: b"event: " + event_type.encode() + b"\ndata: "
+    for event_type in ("preview", "heartbeat", "info", "error")
+}
+
+
+def sse_event(event_type: str, data: Dict[str, Any]) -> bytes:
     """Format a Server-Sent Event."""
-    payload = json.dumps(data, separators=(",", ":"))
-    return f"event: {event_type}\ndata: {payload}\n\n"
+    prefix = _SSE_PREFIXES.get(event_type)
+    if prefix is None:
+        prefix = b"event: " + event_type.encode() + b"\ndata: "
+    return prefix + to_json(data) + b"\n\n"
+
+
+# =============================================================================
+# UDP Receiver
+# =============================================================================
+
+# Packets buffered per preview before new ones are dropped (slow SSE client)
+PREVIEW_QUEUE_SIZE = 1024
+
+
+class _PreviewDatagramProtocol(asyncio.DatagramProtocol):
+    """Queues incoming UDP packets as the event loop reads them off the socket."""
+
+    def __init__(self, queue: asyncio.Queue):
+        self.queue = queue
+
+    def datagram_received(self, data: bytes, addr):
+        try:
+            self.queue.put_nowait(data)
+        except asyncio.QueueFull:
+            pass
 
 
 # =============================================================================
@@ -208,28 +252,20 @@ async def stream_preview(stream_id: UUID):
         return StreamingResponse(
             _connection_info_generator(stream_data),
             media_type="text/event-stream",
-            headers={
-                "Cache-Control": "no-cache",
-                "Connection": "keep-alive",
-                "X-Accel-Buffering": "no",
-            },
+            headers=SSE_HEADERS,
         )
 
     # For proxyable types, set up UDP consumer proxy
     return StreamingResponse(
         _proxy_generator(str(stream_id), stream_data),
         media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",
-        },
+        headers=SSE_HEADERS,
     )
 
 
 async def _connection_info_generator(
     stream_data: Dict[str, Any],
-) -> AsyncGenerator[str, None]:
+) -> AsyncGenerator[bytes, None]:
     """Yield connection info for non-proxyable stream types."""
     info = {
         "status": "connection_info",
@@ -256,7 +292,7 @@ async def _connection_info_generator(
 async def _proxy_generator(
     stream_id: str,
     stream_data: Dict[str, Any],
-) -> AsyncGenerator[str, None]:
+) -> AsyncGenerator[bytes, None]:
     """
     Main proxy generator:
     1. Bind a UDP socket
@@ -279,6 +315,7 @@ async def _proxy_generator(
     stream_type = stream_data.get("stream_type", "")
     decoder = get_decoder(stream_type)
     sock = None
+    transport = None
     local_port = 0
     local_ip = HOST_IP or _get_local_ip()
     registered = False
@@ -328,10 +365,10 @@ async def _proxy_generator(
             yield sse_event("error", {"message": "NATS not connected"})
             return
 
-        subscribe_payload = json.dumps({
+        subscribe_payload = to_json({
             "address": local_ip,
             "port": local_port,
-        }).encode()
+        })
 
         # Publish via NATS→MQTT bridge so the publisher picks it up
         subscribe_subject = f"maestra.to_mqtt.maestra.stream.{stream_id}.subscribe"
@@ -340,12 +377,12 @@ async def _proxy_generator(
         # Also publish directly on the NATS bridge inbound path in case
         # the publisher subscribes to the NATS-side subject directly
         direct_subject = f"maestra.mqtt.maestra.stream.{stream_id}.subscribe"
-        bridge_envelope = json.dumps({
+        bridge_envelope = to_json({
             "timestamp": datetime.utcnow().isoformat() + "Z",
             "source": "mqtt",
             "topic": f"maestra/stream/{stream_id}/subscribe",
             "data": {"address": local_ip, "port": local_port},
-        }).encode()
+        })
         await nc.publish(direct_subject, bridge_envelope)
 
         registered = True
@@ -366,17 +403,18 @@ async def _proxy_generator(
             "local_port": local_port,
         })
 
-        # Receive loop — read UDP packets, decode, yield SSE
-        loop = asyncio.get_event_loop()
+        # Receive loop — the datagram endpoint reads packets as they arrive;
+        # each wakeup drains everything queued since the last one
+        loop = asyncio.get_running_loop()
+        packets: asyncio.Queue = asyncio.Queue(maxsize=PREVIEW_QUEUE_SIZE)
+        transport, _ = await loop.create_datagram_endpoint(
+            lambda: _PreviewDatagramProtocol(packets), sock=sock
+        )
         seq = 0
 
         while True:
             try:
-                # Non-blocking recv with timeout
-                data = await asyncio.wait_for(
-                    loop.sock_recv(sock, 65535),
-                    timeout=5.0,
-                )
+                data = await asyncio.wait_for(packets.get(), timeout=5.0)
             except asyncio.TimeoutError:
                 # No data for 5s — send keepalive
                 yield sse_event("heartbeat", {
@@ -385,18 +423,33 @@ async def _proxy_generator(
                 })
                 continue
 
-            if not data:
-                break
+            batch = [data]
+            while not packets.empty():
+                batch.append(packets.get_nowait())
+
+            # Frame the whole batch into one chunk so the response writes
+            # it to the client in a single send
+            frames = []
+            closed = False
+            for data in batch:
+                if not data:
+                    closed = True
+                    break
+
+                # Decode the packet
+                decoded = decoder(data)
+                if decoded is None:
+                    decoded = decode_raw(data)
 
-            # Decode the packet
-            decoded = decoder(data)
-            if decoded is None:
-                decoded = decode_raw(data)
+                decoded["_seq"] = seq
+                seq += 1
 
-            decoded["_seq"] = seq
-            seq += 1
+                frames.append(sse_event("preview", decoded))
 
-            yield sse_event("preview", decoded)
+            if frames:
+                yield b"".join(frames)
+            if closed:
+                break
 
     except asyncio.CancelledError:
         logger.info("Preview proxy cancelled for stream %s", stream_id)
@@ -412,28 +465,30 @@ async def _proxy_generator(
             try:
                 nc = stream_manager.nc
                 if nc and not nc.is_closed:
-                    unsubscribe_payload = json.dumps({
+                    unsubscribe_payload = to_json({
                         "address": local_ip,
                         "port": local_port,
-                    }).encode()
+                    })
                     unsub_subject = f"maestra.to_mqtt.maestra.stream.{stream_id}.unsubscribe"
                     await nc.publish(unsub_subject, unsubscribe_payload)
 
                     # Also publish on the direct NATS bridge path
                     direct_unsub = f"maestra.mqtt.maestra.stream.{stream_id}.unsubscribe"
-                    unsub_envelope = json.dumps({
+                    unsub_envelope = to_json({
                         "timestamp": datetime.utcnow().isoformat() + "Z",
                         "source": "mqtt",
                         "topic": f"maestra/stream/{stream_id}/unsubscribe",
                         "data": {"address": local_ip, "port": local_port},
-                    }).encode()
+                    })
                     await nc.publish(direct_unsub, unsub_envelope)
                     logger.info("Preview proxy: unregistered consumer %s:%d", local_ip, local_port)
             except Exception as e:
                 logger.warning("Failed to unregister consumer: %s", e)
 
         # Close the UDP socket and release the preview port
-        if sock:
+        if transport:
+            transport.close()
+        elif sock:
             try:
                 sock.close()
             except Exception:
@@ -442,13 +497,21 @@ async def _proxy_generator(
         logger.info("Preview proxy closed for stream %s (port %d)", stream_id, local_port)
 
 
+# LAN IP from the first successful probe; failures are not cached so a later
+# call can pick the address up once the network is available
+_local_ip: Optional[str] = None
+
+
 def _get_local_ip() -> str:
-    """Best-effort guess at this host's LAN IP."""
+    """Best-effort guess at this host's LAN IP, probed until one succeeds."""
+    global _local_ip
+    if _local_ip is not None:
+        return _local_ip
     try:
         s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         s.connect(("8.8.8.8", 80))
-        ip = s.getsockname()[0]
+        _local_ip = s.getsockname()[0]
         s.close()
-        return ip
+        return _local_ip
     except Exception:
         return "127.0.0.1"
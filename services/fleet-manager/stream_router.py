@@ -3,10 +3,12 @@ Stream API Router
 Stream discovery, advertisement, negotiation, and session management
 """
 
-from fastapi import APIRouter, HTTPException, Depends, Query
+import asyncio
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, text
-from typing import Optional, List
+from typing import Optional, List, Dict
 from uuid import UUID
 from datetime import datetime
 
@@ -20,13 +22,49 @@ from stream_manager import stream_manager
 
 router = APIRouter(prefix="/streams", tags=["streams"])
 
+# Serializes the full-state payload straight to JSON bytes in pydantic-core,
+# skipping FastAPI's dump-to-dict then json.dumps pass
+_stream_registry_adapter = TypeAdapter(StreamRegistryState)
+_stream_adapter = TypeAdapter(StreamInfo)
+_streams_adapter = TypeAdapter(List[StreamInfo])
+_sessions_adapter = TypeAdapter(List[StreamSession])
+_session_history_adapter = TypeAdapter(List[StreamSessionHistory])
+_subscribers_adapter = TypeAdapter(List[StreamSubscriber])
+
+# Only the StreamSessionHistory columns; skips the transport_config/metadata JSONB
+_SESSION_HISTORY_SELECT = (
+    "SELECT time, session_id, stream_id, stream_name, stream_type, publisher_id,"
+    " consumer_id, protocol, status, duration_seconds, bytes_transferred,"
+    " error_message FROM stream_sessions WHERE 1=1"
+)
+
 
 # =============================================================================
 # Helpers
 # =============================================================================
 
+# Converted stream types keyed by id, each stored with the updated_at it was built
+# from; a changed row replaces its entry and the oldest entries go past the cap
+_STREAM_TYPE_CACHE_SIZE = 256
+_stream_type_cache: Dict[UUID, tuple] = {}
+
+
 def stream_type_db_to_response(db_type: StreamTypeDB) -> StreamTypeInfo:
     """Convert database model to response model"""
+    if db_type.updated_at is None:
+        return _build_stream_type_info(db_type)
+    cached = _stream_type_cache.get(db_type.id)
+    if cached is not None and cached[0] == db_type.updated_at:
+        return cached[1]
+    info = _build_stream_type_info(db_type)
+    _stream_type_cache.pop(db_type.id, None)
+    if len(_stream_type_cache) >= _STREAM_TYPE_CACHE_SIZE:
+        del _stream_type_cache[next(iter(_stream_type_cache))]
+    _stream_type_cache[db_type.id] = (db_type.updated_at, info)
+    return info
+
+
+def _build_stream_type_info(db_type: StreamTypeDB) -> StreamTypeInfo:
     return StreamTypeInfo(
         id=db_type.id,
         name=db_type.name,
@@ -40,6 +78,15 @@ def stream_type_db_to_response(db_type: StreamTypeDB) -> StreamTypeInfo:
     )
 
 
+def _validated_response(adapter: TypeAdapter, data, status_code: int = 200) -> Response:
+    """Validate raw Redis/Postgres data and serialize it in one pydantic-core pass"""
+    return Response(
+        content=adapter.dump_json(adapter.validate_python(data), by_alias=True),
+        media_type="application/json",
+        status_code=status_code,
+    )
+
+
 # =============================================================================
 # Full State Endpoint (single fetch for dashboard)
 # =============================================================================
@@ -47,29 +94,26 @@ def stream_type_db_to_response(db_type: StreamTypeDB) -> StreamTypeInfo:
 @router.get("/state", response_model=StreamRegistryState)
 async def get_stream_state(db: AsyncSession = Depends(get_db)):
     """Get complete stream state: all streams, sessions, and types"""
-    # Stream types from Postgres
-    result = await db.execute(
-        select(StreamTypeDB).order_by(StreamTypeDB.name)
+    # Stream types from Postgres alongside active streams, sessions and
+    # (multicast) subscribers from Redis, fetched concurrently
+    result, streams_data, sessions_data, subscribers_data = await asyncio.gather(
+        db.execute(select(StreamTypeDB).order_by(StreamTypeDB.name)),
+        stream_manager.list_streams(),
+        stream_manager.list_sessions(),
+        stream_manager.list_subscribers(),
     )
     stream_types = [stream_type_db_to_response(t) for t in result.scalars().all()]
 
-    # Active streams from Redis
-    streams_data = await stream_manager.list_streams()
-    streams = [StreamInfo(**s) for s in streams_data]
-
-    # Active sessions from Redis
-    sessions_data = await stream_manager.list_sessions()
-    sessions = [StreamSession(**s) for s in sessions_data]
-
-    # Active subscribers from Redis (multicast)
-    subscribers_data = await stream_manager.list_subscribers()
-    subscribers = [StreamSubscriber(**s) for s in subscribers_data]
-
-    return StreamRegistryState(
-        streams=streams,
-        sessions=sessions,
-        stream_types=stream_types,
-        subscribers=subscribers,
+    # Redis rows are validated straight into the state model
+    state = _stream_registry_adapter.validate_python({
+        "streams": streams_data,
+        "sessions": sessions_data,
+        "stream_types": stream_types,
+        "subscribers": subscribers_data,
+    })
+    return Response(
+        content=_stream_registry_adapter.dump_json(state, by_alias=True),
+        media_type="application/json",
     )
 
 
@@ -129,7 +173,7 @@ async def list_streams(
         raise HTTPException(status_code=503, detail="Stream manager not connected")
 
     streams_data = await stream_manager.list_streams(stream_type=stream_type)
-    return [StreamInfo(**s) for s in streams_data]
+    return _validated_response(_streams_adapter, streams_data)
 
 
 @router.post("/advertise", response_model=StreamInfo, status_code=201)
@@ -139,7 +183,7 @@ async def advertise_stream(advert: StreamAdvertise):
         raise HTTPException(status_code=503, detail="Stream manager not connected")
 
     stream_data = await stream_manager.advertise_stream(advert.model_dump())
-    return StreamInfo(**stream_data)
+    return _validated_response(_stream_adapter, stream_data, status_code=201)
 
 
 # =============================================================================
@@ -160,7 +204,7 @@ async def list_sessions(
     sessions_data = await stream_manager.list_sessions(
         stream_id=str(stream_id) if stream_id else None
     )
-    return [StreamSession(**s) for s in sessions_data]
+    return _validated_response(_sessions_adapter, sessions_data)
 
 
 @router.get("/sessions/history", response_model=List[StreamSessionHistory])
@@ -172,7 +216,9 @@ async def get_session_history(
     db: AsyncSession = Depends(get_db),
 ):
     """Query historical session records from Postgres"""
-    query = "SELECT * FROM stream_sessions WHERE 1=1"
+    # At most eight distinct statements, one per filter combination, so each
+    # stays in asyncpg's prepared-statement cache and keeps its own index plan
+    query = _SESSION_HISTORY_SELECT
     params = {}
 
     if stream_id:
@@ -191,23 +237,7 @@ async def get_session_history(
     result = await db.execute(text(query), params)
     rows = result.mappings().all()
 
-    return [
-        StreamSessionHistory(
-            time=row["time"],
-            session_id=row["session_id"],
-            stream_id=row["stream_id"],
-            stream_name=row["stream_name"],
-            stream_type=row["stream_type"],
-            publisher_id=row["publisher_id"],
-            consumer_id=row["consumer_id"],
-            protocol=row["protocol"],
-            status=row["status"],
-            duration_seconds=row.get("duration_seconds"),
-            bytes_transferred=row.get("bytes_transferred", 0),
-            error_message=row.get("error_message"),
-        )
-        for row in rows
-    ]
+    return _validated_response(_session_history_adapter, [dict(row) for row in rows])
 
 
 @router.delete("/sessions/{session_id}")
@@ -216,10 +246,7 @@ async def stop_session(session_id: UUID):
     if not stream_manager.is_connected:
         raise HTTPException(status_code=503, detail="Stream manager not connected")
 
-    db_session = async_session_maker()
-    stopped = await stream_manager.stop_session(
-        str(session_id), db_session=db_session
-    )
+    stopped = await stream_manager.stop_session(str(session_id))
     if not stopped:
         raise HTTPException(status_code=404, detail="Session not found or expired")
 
@@ -256,7 +283,7 @@ async def list_all_subscribers(
     subscribers_data = await stream_manager.list_subscribers(
         stream_id=str(stream_id) if stream_id else None
     )
-    return [StreamSubscriber(**s) for s in subscribers_data]
+    return _validated_response(_subscribers_adapter, subscribers_data)
 
 
 @router.post("/subscribers/{subscriber_id}/heartbeat")
@@ -286,7 +313,7 @@ async def get_stream(stream_id: UUID):
     if not stream_data:
         raise HTTPException(status_code=404, detail="Stream not found or expired")
 
-    return StreamInfo(**stream_data)
+    return _validated_response(_stream_adapter, stream_data)
 
 
 @router.delete("/{stream_id}")
@@ -369,7 +396,7 @@ async def list_stream_subscribers(stream_id: UUID):
     subscribers_data = await stream_manager.list_subscribers(
         stream_id=str(stream_id)
     )
-    return [StreamSubscriber(**s) for s in subscribers_data]
+    return _validated_response(_subscribers_adapter, subscribers_data)
 
 
 @router.post("/{stream_id}/request", response_model=StreamOffer)
@@ -389,9 +416,6 @@ async def request_stream(stream_id: UUID, req: StreamRequest):
             detail="This is a multicast stream. Use POST /streams/{stream_id}/join instead.",
         )
 
-    # Get a fresh DB session for logging (fire-and-forget)
-    db_session = async_session_maker()
-
     try:
         offer = await stream_manager.request_stream(
             stream_id=str(stream_id),
@@ -399,7 +423,6 @@ async def request_stream(stream_id: UUID, req: StreamRequest):
             consumer_address=req.consumer_address,
             consumer_port=req.consumer_port,
             config=req.config,
-            db_session=db_session,
         )
         return StreamOffer(**offer)
     except ValueError as e:
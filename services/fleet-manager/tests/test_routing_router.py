@@ -0,0 +1,32 @@
+"""Statement-building tests for routing_router (no database needed)."""
+
+from uuid import uuid4
+
+import pytest
+
+pytest.importorskip("asyncpg")  # database.py creates the asyncpg engine at import
+
+from sqlalchemy.dialects import postgresql  # noqa: E402
+
+from routing_router import _copy_routes  # noqa: E402
+
+
+def _compile(statement):
+    return statement.compile(dialect=postgresql.dialect())
+
+
+@pytest.mark.parametrize(
+    "from_preset_id, to_preset_id",
+    [(None, uuid4()), (uuid4(), None)],
+    ids=["save-to-preset", "recall-preset"],
+)
+def test_copy_routes_compiles(from_preset_id, to_preset_id):
+    compiled = _compile(_copy_routes(from_preset_id, to_preset_id))
+    sql = str(compiled)
+
+    assert sql.startswith(
+        "INSERT INTO routes (from_device_id, from_port, to_device_id, to_port, preset_id, metadata) SELECT"
+    )
+    # id and created_at are left to the column server defaults
+    assert "created_at" not in sql
+    assert to_preset_id in compiled.params.values()
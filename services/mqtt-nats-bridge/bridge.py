@@ -6,7 +6,7 @@ Bidirectional message routing between MQTT and NATS
 import asyncio
 import os
 import json
-from datetime import datetime
+from datetime import datetime, timezone
 import paho.mqtt.client as mqtt
 import nats
 from nats.aio.client import Client as NATS
@@ -15,15 +15,24 @@ from nats.aio.client import Client as NATS
 MQTT_BROKER = os.getenv('MQTT_BROKER', 'mosquitto')
 MQTT_PORT = int(os.getenv('MQTT_PORT', 1883))
 NATS_URL = os.getenv('NATS_URL', 'nats://nats:4222')
+MQTT_QUEUE_SIZE = int(os.getenv('MQTT_QUEUE_SIZE', 10000))
 
 # Topic mapping configuration
 MQTT_TO_NATS_PREFIX = "maestra.mqtt"  # MQTT topic "device/sensor" -> NATS "maestra.mqtt.device.sensor"
 NATS_TO_MQTT_SUBJECT = "maestra.to_mqtt.>"  # NATS "maestra.to_mqtt.device.cmd" -> MQTT "device/cmd"
+NATS_TO_MQTT_PREFIX = "maestra.to_mqtt."
+_NATS_TO_MQTT_PREFIX_LEN = len(NATS_TO_MQTT_PREFIX)
+
+# Single-pass separator translation tables
+_TO_NATS = str.maketrans("/", ".")
+_TO_MQTT = str.maketrans(".", "/")
 
 # Global clients
 nc: NATS = None
 mqtt_client: mqtt.Client = None
 _loop: asyncio.AbstractEventLoop = None  # main asyncio loop, for cross-thread scheduling
+_mqtt_queue: asyncio.Queue = None  # (topic, payload, qos) waiting to be forwarded to NATS
+mqtt_dropped = 0
 
 
 async def connect_nats():
@@ -39,8 +48,7 @@ def mqtt_topic_to_nats_subject(topic: str) -> str:
     Example: "maestra/devices/esp32/sensor" -> "maestra.mqtt.maestra.devices.esp32.sensor"
     """
     # Replace / with . for NATS subject format
-    subject = topic.replace('/', '.')
-    return f"{MQTT_TO_NATS_PREFIX}.{subject}"
+    return f"{MQTT_TO_NATS_PREFIX}.{topic.translate(_TO_NATS)}"
 
 
 def nats_subject_to_mqtt_topic(subject: str) -> str:
@@ -49,10 +57,9 @@ def nats_subject_to_mqtt_topic(subject: str) -> str:
     Example: "maestra.to_mqtt.devices.esp32.cmd" -> "devices/esp32/cmd"
     """
     # Remove the "maestra.to_mqtt." prefix
-    if subject.startswith("maestra.to_mqtt."):
-        topic = subject[len("maestra.to_mqtt."):]
+    if subject.startswith(NATS_TO_MQTT_PREFIX):
         # Replace . with / for MQTT topic format
-        return topic.replace('.', '/')
+        return subject[_NATS_TO_MQTT_PREFIX_LEN:].translate(_TO_MQTT)
     return subject
 
 
@@ -70,35 +77,50 @@ def on_mqtt_connect(client, userdata, flags, reason_code, properties):
 def on_mqtt_message(client, userdata, msg):
     """
     Callback when MQTT message received
-    Forward to NATS
+    Hand off to the NATS forwarder on the asyncio loop
     """
-    topic = msg.topic
-    payload = msg.payload.decode('utf-8', errors='ignore')
-
-    print(f"📨 MQTT -> NATS: {topic}")
-
-    # Convert MQTT topic to NATS subject
-    nats_subject = mqtt_topic_to_nats_subject(topic)
+    if _loop and _mqtt_queue is not None:
+        _loop.call_soon_threadsafe(_enqueue_mqtt, (msg.topic, msg.payload, msg.qos))
 
-    # Create message envelope with metadata
-    message = {
-        "source": "mqtt",
-        "topic": topic,
-        "payload": payload,
-        "qos": msg.qos,
-        "timestamp": datetime.utcnow().isoformat()
-    }
 
-    # Try to parse as JSON, otherwise keep as string
+def _enqueue_mqtt(item: tuple):
+    """Queue an MQTT message for forwarding, dropping it if the queue is full"""
+    global mqtt_dropped
     try:
-        parsed = json.loads(payload)
-        message["data"] = parsed
-    except (json.JSONDecodeError, ValueError):
-        message["data"] = payload
+        _mqtt_queue.put_nowait(item)
+    except asyncio.QueueFull:
+        mqtt_dropped += 1
+
+
+async def forward_mqtt_to_nats():
+    """Forward queued MQTT messages to NATS from a single long-lived task"""
+    while True:
+        topic, raw, qos = await _mqtt_queue.get()
+        payload = raw.decode('utf-8', errors='ignore')
+
+        print(f"📨 MQTT -> NATS: {topic}")
+
+        # Convert MQTT topic to NATS subject
+        nats_subject = mqtt_topic_to_nats_subject(topic)
+
+        # Create message envelope with metadata
+        message = {
+            "source": "mqtt",
+            "topic": topic,
+            "payload": payload,
+            "qos": qos,
+            "timestamp": datetime.now(timezone.utc).isoformat()
+        }
+
+        # Try to parse as JSON, otherwise keep as string
+        try:
+            parsed = json.loads(payload)
+            message["data"] = parsed
+        except (json.JSONDecodeError, ValueError):
+            message["data"] = payload
 
-    # Publish to NATS (schedule on the main asyncio loop from paho's thread)
-    if nc and _loop:
-        asyncio.run_coroutine_threadsafe(publish_to_nats(nats_subject, message), _loop)
+        if nc:
+            await publish_to_nats(nats_subject, message)
 
 
 async def publish_to_nats(subject: str, message: dict):
@@ -165,7 +187,7 @@ def setup_mqtt():
 async def main():
     """Main bridge loop"""
 
-    global _loop
+    global _loop, _mqtt_queue
 
     print("🚀 Starting Maestra MQTT-NATS Bridge...")
     print("=" * 60)
@@ -179,6 +201,10 @@ async def main():
     # Subscribe to NATS for outgoing MQTT messages
     await subscribe_nats_to_mqtt()
 
+    # Start the MQTT -> NATS forwarder before MQTT can deliver messages
+    _mqtt_queue = asyncio.Queue(maxsize=MQTT_QUEUE_SIZE)
+    forwarder = asyncio.create_task(forward_mqtt_to_nats())
+
     # Setup MQTT client
     setup_mqtt()
 
@@ -204,6 +230,7 @@ async def main():
         if mqtt_client:
             mqtt_client.loop_stop()
             mqtt_client.disconnect()
+        forwarder.cancel()
         if nc:
             await nc.close()
 
@@ -8,7 +8,8 @@ import asyncio
 import os
 import json
 import re
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
 from pythonosc import dispatcher, osc_server, udp_client
 from pythonosc.osc_server import AsyncIOOSCUDPServer
 import nats
@@ -185,6 +186,15 @@ def osc_safe_value(value):
 # Inbound: OSC → NATS
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=4096)
+def osc_address_to_nats_subject(address: str) -> str:
+    """
+    Convert OSC address to NATS subject (cached; senders reuse a small set of addresses)
+    Example: "/td/slider1" -> "maestra.osc.td.slider1"
+    """
+    return f"maestra.osc{address.replace('/', '.')}"
+
+
 async def _osc_handler_async(address: str, *args):
     """
     Async implementation of the OSC handler.
@@ -225,12 +235,12 @@ async def _osc_handler_async(address: str, *args):
 
     # --- Always publish to maestra.osc.* (existing behavior) ---
     message = {
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
         "source": "osc",
         "address": address,
         "values": list(args)
     }
-    nats_subject = f"maestra.osc{address.replace('/', '.')}"
+    nats_subject = osc_address_to_nats_subject(address)
 
     try:
         await nc.publish(nats_subject, json.dumps(message).encode())
@@ -4,8 +4,10 @@ Bridges WebSocket connections (browser SDK, web apps) to NATS/Redis
 """
 
 import asyncio
+import logging
+import multiprocessing
 import websockets
-import json
+import orjson
 import os
 from datetime import datetime
 from typing import Set
@@ -15,10 +17,34 @@ from nats.aio.client import Client as NATS
 # Configuration
 WS_PORT = int(os.getenv('WS_PORT', 8765))
 NATS_URL = os.getenv('NATS_URL', 'nats://nats:4222')
+# permessage-deflate compresses each frame once per client; broadcasts are small
+# JSON, so it is off unless WS_COMPRESSION=deflate
+WS_COMPRESSION = "deflate" if os.getenv('WS_COMPRESSION', 'none') == 'deflate' else None
+# Clients with more unsent bytes than this are disconnected as slow consumers
+WS_MAX_CLIENT_BUFFER = int(os.getenv('WS_MAX_CLIENT_BUFFER', 1024 * 1024))
+SLOW_CLIENT_CHECK_INTERVAL = 1.0
+# Worker processes sharing WS_PORT via SO_REUSEPORT; each has its own NATS
+# subscription, so every worker broadcasts to its own clients
+WS_WORKERS = max(1, int(os.getenv('WS_WORKERS', 1)))
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
+
+# Per-message traffic logs at DEBUG; connection events at INFO
+logging.basicConfig(
+    level=getattr(logging, LOG_LEVEL, logging.INFO),
+    format='%(asctime)s [%(levelname)s] %(name)s: %(message)s',
+)
+logger = logging.getLogger('websocket-gateway')
+
+# Fixed-shape control frames; only the timestamp is spliced in per send
+_PONG_PREFIX = '{"type":"pong","timestamp":"'
+_INVALID_JSON_PREFIX = '{"type":"error","message":"Invalid JSON","timestamp":"'
+_FRAME_SUFFIX = '"}'
 
 # Global state
 nc: NATS = None
 connected_clients: Set[websockets.WebSocketServerProtocol] = set()
+# Strong references to in-flight slow-client closes so they aren't collected mid-close
+_close_tasks: Set[asyncio.Task] = set()
 
 
 async def connect_nats():
@@ -36,30 +62,51 @@ async def nats_message_handler(msg):
     """
     subject = msg.subject
 
-    print(f"📨 NATS -> WS: {subject}")
+    logger.debug("NATS -> WS: %s", subject)
 
     # Broadcast to all connected WebSocket clients
     if connected_clients:
         # Parse JSON safely — binary or malformed NATS payloads should not crash the gateway
         try:
-            data = msg.data.decode()
-            parsed_data = json.loads(data) if data else None
-        except (json.JSONDecodeError, UnicodeDecodeError):
-            raw = msg.data[:500].decode(errors='replace') if msg.data else None
+            parsed_data = orjson.loads(msg.data) if msg.data else None
+        except orjson.JSONDecodeError:
+            raw = msg.data[:500].decode(errors='replace')
             parsed_data = {"_raw": raw, "_error": "non-JSON payload"}
 
-        message = json.dumps({
+        # Decoded once so clients keep receiving text frames
+        message = orjson.dumps({
             "type": "message",
             "subject": subject,
             "data": parsed_data,
-            "timestamp": datetime.utcnow().isoformat()
-        })
+            "timestamp": datetime.utcnow()
+        }).decode()
 
         # Concurrent broadcast — fire-and-forget to all clients.
         # Stale clients are cleaned up in handle_websocket_client's finally block.
         websockets.broadcast(connected_clients, message)
 
 
+async def evict_slow_clients():
+    """
+    Periodically disconnect clients that can't keep up with broadcasts
+
+    websockets.broadcast never waits for a client to drain, so a stalled
+    connection's write buffer would otherwise grow without bound.
+    """
+    while True:
+        await asyncio.sleep(SLOW_CLIENT_CHECK_INTERVAL)
+        slow = [
+            ws for ws in connected_clients
+            if ws.transport.get_write_buffer_size() > WS_MAX_CLIENT_BUFFER
+        ]
+        for ws in slow:
+            logger.warning("Disconnecting slow client: %s (ID: %s)", ws.remote_address, id(ws))
+            connected_clients.discard(ws)
+            task = asyncio.create_task(ws.close(1008, "slow consumer"))
+            _close_tasks.add(task)
+            task.add_done_callback(_close_tasks.discard)
+
+
 async def subscribe_nats():
     """Subscribe to NATS topics for WebSocket broadcast"""
     if nc:
@@ -78,7 +125,7 @@ async def handle_websocket_client(websocket: websockets.WebSocketServerProtocol)
     client_id = id(websocket)
     remote_address = websocket.remote_address
 
-    print(f"🔌 Client connected: {remote_address} (ID: {client_id})")
+    logger.info("Client connected: %s (ID: %s)", remote_address, client_id)
 
     # Add to connected clients
     connected_clients.add(websocket)
@@ -87,27 +134,24 @@ async def handle_websocket_client(websocket: websockets.WebSocketServerProtocol)
     welcome = {
         "type": "welcome",
         "client_id": client_id,
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": datetime.utcnow(),
         "message": "Connected to Maestra WebSocket Gateway"
     }
-    await websocket.send(json.dumps(welcome))
+    await websocket.send(orjson.dumps(welcome).decode())
 
     try:
         # Listen for messages from client
         async for message in websocket:
             try:
-                data = json.loads(message)
+                data = orjson.loads(message)
                 await handle_client_message(websocket, data)
-            except json.JSONDecodeError:
-                error = {
-                    "type": "error",
-                    "message": "Invalid JSON",
-                    "timestamp": datetime.utcnow().isoformat()
-                }
-                await websocket.send(json.dumps(error))
+            except orjson.JSONDecodeError:
+                await websocket.send(
+                    _INVALID_JSON_PREFIX + datetime.utcnow().isoformat() + _FRAME_SUFFIX
+                )
 
     except websockets.exceptions.ConnectionClosed:
-        print(f"🔌 Client disconnected: {remote_address} (ID: {client_id})")
+        logger.info("Client disconnected: %s (ID: %s)", remote_address, client_id)
     finally:
         # Remove from connected clients
         connected_clients.discard(websocket)
@@ -121,48 +165,47 @@ async def handle_client_message(websocket, data: dict):
     {
         "type": "publish" | "subscribe" | "unsubscribe",
         "subject": "maestra.topic.name",
-        "data": {...}
+        "data": {...},
+        "ack": false            (optional; skip the publish ack)
     }
     """
     msg_type = data.get("type")
     subject = data.get("subject", "")
 
-    print(f"📨 WS -> NATS: {msg_type} {subject}")
+    logger.debug("WS -> NATS: %s %s", msg_type, subject)
 
     if msg_type == "publish":
         # Publish message to NATS
         if nc and subject:
             message = {
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": datetime.utcnow(),
                 "source": "websocket",
                 "data": data.get("data", {})
             }
-            await nc.publish(subject, json.dumps(message).encode())
+            await nc.publish(subject, orjson.dumps(message))
 
-            # Acknowledge
+            # Acknowledge unless the client opted out
+            if data.get("ack") is False:
+                return
             ack = {
                 "type": "ack",
                 "subject": subject,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": datetime.utcnow()
             }
-            await websocket.send(json.dumps(ack))
+            await websocket.send(orjson.dumps(ack).decode())
 
     elif msg_type == "ping":
         # Respond to ping
-        pong = {
-            "type": "pong",
-            "timestamp": datetime.utcnow().isoformat()
-        }
-        await websocket.send(json.dumps(pong))
+        await websocket.send(_PONG_PREFIX + datetime.utcnow().isoformat() + _FRAME_SUFFIX)
 
     else:
         # Unknown message type
         error = {
             "type": "error",
             "message": f"Unknown message type: {msg_type}",
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": datetime.utcnow()
         }
-        await websocket.send(json.dumps(error))
+        await websocket.send(orjson.dumps(error).decode())
 
 
 async def main():
@@ -176,8 +219,13 @@ async def main():
     # Subscribe to NATS topics
     await subscribe_nats()
 
+    eviction_task = asyncio.create_task(evict_slow_clients())
+
     # Start WebSocket server
-    async with websockets.serve(handle_websocket_client, "0.0.0.0", WS_PORT):
+    async with websockets.serve(
+        handle_websocket_client, "0.0.0.0", WS_PORT,
+        compression=WS_COMPRESSION, reuse_port=WS_WORKERS > 1,
+    ):
         print(f"🌐 WebSocket server listening on 0.0.0.0:{WS_PORT}")
         print(f"   - Connected to NATS at {NATS_URL}")
         print("\n📚 Usage Example (JavaScript):")
@@ -191,9 +239,23 @@ async def main():
         except KeyboardInterrupt:
             print("\n👋 Shutting down WebSocket Gateway...")
         finally:
+            eviction_task.cancel()
             if nc:
                 await nc.close()
 
 
+def run():
+    """Run one gateway process"""
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Extra workers exit with this process
+    for _ in range(WS_WORKERS - 1):
+        multiprocessing.Process(target=run, daemon=True).start()
+    run()